@@ -3,19 +3,29 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, CoreState, EVENT_HOMEASSISTANT_STARTED
-from homeassistant.helpers import config_validation as cv
+from homeassistant.core import HomeAssistant, CoreState, EVENT_HOMEASSISTANT_STARTED, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api import messages
 import voluptuous as vol
 
-from .const import DOMAIN, PLATFORMS, INTEGRATION_VERSION
+from .const import DOMAIN, PLATFORMS, INTEGRATION_VERSION, SERVICE_REFRESH_PARCELS, ATTR_TRACKING_NUMBERS
 from .frontend import JSModuleRegistration
+from .archive import async_get_archive
 from .coordinator import ShipmentCoordinator
+from .parcel_registry import async_get_parcel_registry
+from .scheduler import async_get_poll_scheduler
+from .session_manager import async_get_session_manager
+from .state_store import ParcelStateStore
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+REFRESH_PARCELS_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_TRACKING_NUMBERS): vol.All(cv.ensure_list, [cv.string])}
+)
+
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Shipment Tracking integration."""
     hass.data.setdefault(DOMAIN, {})
@@ -38,6 +48,118 @@ async def async_setup(hass: HomeAssistant, config: dict):
 
     websocket_api.async_register_command(hass, websocket_get_version)
 
+    # Websocket handler exposing courier connection pool statistics.
+    @websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/pool_stats"})
+    @callback
+    def websocket_get_pool_stats(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict,
+    ) -> None:
+        """Handle connection pool statistics requests."""
+        connection.send_result(msg["id"], async_get_session_manager(hass).stats)
+
+    websocket_api.async_register_command(hass, websocket_get_pool_stats)
+
+    # Websocket handler exposing poll scheduler queue depth and running polls.
+    @websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/poll_stats"})
+    @callback
+    def websocket_get_poll_stats(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict,
+    ) -> None:
+        """Handle poll scheduler statistics requests."""
+        connection.send_result(msg["id"], async_get_poll_scheduler(hass).stats)
+
+    websocket_api.async_register_command(hass, websocket_get_poll_stats)
+
+    # Websocket handler paging through archived (finished) parcels.
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/archive",
+            vol.Optional("courier"): str,
+            vol.Optional("entry_id"): str,
+            vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+            vol.Optional("limit", default=50): vol.All(int, vol.Range(min=1, max=500)),
+        }
+    )
+    @websocket_api.async_response
+    async def websocket_query_archive(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict,
+    ) -> None:
+        """Handle archive queries."""
+        result = await async_get_archive(hass).async_query(
+            courier=msg.get("courier"),
+            entry_id=msg.get("entry_id"),
+            offset=msg["offset"],
+            limit=msg["limit"],
+        )
+        connection.send_result(msg["id"], result)
+
+    websocket_api.async_register_command(hass, websocket_query_archive)
+
+    # Websocket handler serving a parcel's raw courier payload to the card.
+    @websocket_api.websocket_command(
+        {
+            vol.Required("type"): f"{DOMAIN}/raw_payload",
+            vol.Required("entity_id"): cv.entity_id,
+        }
+    )
+    @callback
+    def websocket_get_raw_payload(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict,
+    ) -> None:
+        """Handle raw payload requests for a shipment sensor."""
+        entity_entry = er.async_get(hass).async_get(msg["entity_id"])
+        state = hass.states.get(msg["entity_id"])
+        coordinator = (
+            hass.data[DOMAIN].get(entity_entry.config_entry_id) if entity_entry else None
+        )
+        encoded = None
+        if isinstance(coordinator, ShipmentCoordinator) and state is not None:
+            tracking_number = state.attributes.get("tracking_number")
+            if tracking_number:
+                encoded = coordinator.get_encoded_payload(tracking_number)
+        if encoded is None:
+            connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Shipment not found")
+            return
+        # Already-encoded JSON; skip re-serializing the payload for every request.
+        connection.send_message(messages.construct_result_message(msg["id"], encoded))
+
+    websocket_api.async_register_command(hass, websocket_get_raw_payload)
+
+    async def async_handle_refresh_parcels(call: ServiceCall) -> None:
+        """Refresh the given parcels on whichever accounts track them."""
+        requested = {str(number).strip() for number in call.data[ATTR_TRACKING_NUMBERS]}
+        registry = async_get_parcel_registry(hass)
+        found = set()
+        for coordinator in list(hass.data[DOMAIN].values()):
+            if not isinstance(coordinator, ShipmentCoordinator):
+                continue
+            # Only the owning account fetches; it shares the result with the others.
+            tracking_numbers = {
+                number
+                for number in requested
+                if registry.owner(coordinator.courier, number) is coordinator
+            }
+            if tracking_numbers:
+                found |= tracking_numbers
+                await coordinator.async_refresh_parcels(tracking_numbers)
+        if missing := requested - found:
+            _LOGGER.warning("No active shipment found for: %s", ", ".join(sorted(missing)))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_PARCELS,
+        async_handle_refresh_parcels,
+        schema=REFRESH_PARCELS_SCHEMA,
+    )
+
     # Schedule frontend registration based on HA state.
     if hass.state == CoreState.running:
         await async_register_frontend()
@@ -49,7 +171,21 @@ async def async_setup(hass: HomeAssistant, config: dict):
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up from a config entry."""
     coordinator = ShipmentCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    if await coordinator.async_hydrate():
+        # Entities start from the cached parcels; revalidate without blocking setup.
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} first refresh {entry.entry_id}",
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Setup is retried with a new coordinator; cancel the polls,
+            # pre-warm and token refresh this one has already scheduled.
+            await coordinator.async_shutdown()
+            raise
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -61,7 +197,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     # If no more entries, unregister frontend? 
     # Actually, keep it for now as there might be other entries.
@@ -69,3 +206,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data of a deleted config entry."""
+    await ParcelStateStore(hass, entry).async_remove()
+
@@ -1,16 +1,19 @@
 import aiohttp
 import urllib.parse
-from .api_helpers import normalize_phone, request_json
+from .api_helpers import SingleFlight, iter_pages, normalize_phone, request_json
 
 
 class DhlApi:
     BASE_URL = "https://mojdhl.pl/api/dhl/public"
+    PREWARM_URL = BASE_URL
 
     def __init__(self, session: aiohttp.ClientSession, device_id: str | None = None):
         self._session = session
         self._token = None
         self._cookies = {}
         self._device_id = device_id
+        self._inflight = SingleFlight()
+        self.metrics = None
 
     async def request(self, method: str, path: str, data: dict | None = None):
         url = f"{self.BASE_URL}/{path.lstrip('/')}"
@@ -46,6 +49,8 @@ class DhlApi:
             log_401_as_info=True,
             error_with_text=True,
             on_response=_capture_cookies,
+            single_flight=self._inflight,
+            metrics=self.metrics,
         )
 
     async def validate_account(self, phone):
@@ -105,16 +110,32 @@ class DhlApi:
         return data
 
     async def get_parcels(self):
+        return await self.get_parcels_page(1)
+
+    async def get_parcels_page(self, page: int):
         return await self.request(
             "POST",
-            "user/shipment/v2.1/list/incoming/active/1",
+            f"user/shipment/v2.1/list/incoming/active/{page}",
             {
                 "shipmentFilterTypes": [],
                 "shipmentFilterStatuses": [],
-                "page": 1,
+                "page": page,
             },
         )
 
+    def iter_parcel_pages(self, first):
+        """Yield the first list page and then the remaining ones.
+
+        Without a ``totalPages`` field, pages are fetched while they are full.
+        """
+        return iter_pages(first, self.get_parcels_page, count_items=_count_shipments)
+
     async def get_parcel(self, shipment_number: str):
         encoded = urllib.parse.quote(str(shipment_number), safe="")
         return await self.request("GET", f"user/shipment/v2/details/{encoded}")
+
+
+def _count_shipments(data) -> int:
+    """Return the number of shipments on one list page."""
+    shipments = data.get("shipments") if isinstance(data, dict) else None
+    return len(shipments) if isinstance(shipments, list) else 0
@@ -3,7 +3,13 @@ import logging
 import time
 import urllib.parse
 
-from .api_helpers import normalize_phone, request_json
+from .api_helpers import (
+    CourierApiError,
+    CourierAuthError,
+    SingleFlight,
+    normalize_phone,
+    request_json,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,12 +18,17 @@ class DpdApi:
     SSO_URL = "https://dpdsso.dpd.com.pl"
     API_URL = "https://mobapp.dpd.com.pl"
     CLIENT_ID = "DPDClientMDU"
+    PREWARM_URL = API_URL
 
     def __init__(self, session: aiohttp.ClientSession):
         self._session = session
         self._token = None
         self._refresh_token = None
         self._expires_at = 0
+        self._inflight = SingleFlight()
+        self.metrics = None
+        # Optional coroutine used instead of refresh_access_token to serialise refreshes.
+        self.token_refresher = None
 
     async def request(self, method, url, data=None, headers=None, form_data=None):
         if headers is None:
@@ -25,7 +36,10 @@ class DpdApi:
 
         # Refresh access token if it is about to expire
         if self._token and self._refresh_token and time.time() > self._expires_at - 60:
-            await self.refresh_access_token()
+            if self.token_refresher is not None:
+                await self.token_refresher()
+            else:
+                await self.refresh_access_token()
 
         default_headers = {
             "Accept": "application/json",
@@ -51,6 +65,8 @@ class DpdApi:
             label="DPD",
             log_401_as_info=True,
             error_with_text=False,
+            single_flight=self._inflight,
+            metrics=self.metrics,
         )
 
     async def send_sms_code(self, phone_number):
@@ -101,7 +117,8 @@ class DpdApi:
             async with self._session.post(url, data=form_data) as resp:
                 if resp.status != 200:
                     text = await resp.text()
-                    raise Exception(f"DPD refresh failed: {resp.status} {text}")
+                    error_class = CourierAuthError if resp.status in (400, 401) else CourierApiError
+                    raise error_class(f"DPD refresh failed: {resp.status} {text}", status=resp.status)
                 data = await resp.json()
                 if not data.get("access_token"):
                     raise Exception("DPD refresh failed: missing access_token")
@@ -1,15 +1,237 @@
 import aiohttp
 import asyncio
 import async_timeout
+import email.utils
 import json
 import logging
 import re
+import time
+import urllib.parse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# orjson silently turns integers beyond 64 bits into floats. Such long digit
+# runs are rare, so bodies containing one are left to the lossless stdlib.
+_LONG_DIGITS = re.compile(r"[0-9]{19,}")
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19,}")
+
+
+def _json_loads_lossless(data):
+    """Decode JSON with orjson unless it may hold integers orjson cannot keep."""
+    pattern = _LONG_DIGITS_BYTES if isinstance(data, (bytes, bytearray)) else _LONG_DIGITS
+    if pattern.search(data):
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+# Default decoder for response bodies; accepts bytes directly.
+json_loads = _json_loads_lossless if orjson is not None else json.loads
+
+# Bodies larger than this are decoded in the executor to keep the event loop free.
+EXECUTOR_DECODE_THRESHOLD = 256 * 1024
+
+# Returned by request_json when the server answers 304 to a conditional request.
+NOT_MODIFIED = object()
+
+# Paged lists: pages fetched at once after the first, and a safety cap.
+PAGE_FETCH_CONCURRENCY = 3
+MAX_PAGES = 50
+
+
+class CourierApiError(Exception):
+    """Base error for failed courier API calls."""
+
+    retryable = False
+
+    def __init__(self, message: str, *, status: int | None = None, retry_after: float | None = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CourierAuthError(CourierApiError):
+    """The courier rejected the access token."""
+
+
+class CourierRateLimitError(CourierApiError):
+    """The courier throttled the request (HTTP 429)."""
+
+    retryable = True
+
+
+class CourierServerError(CourierApiError):
+    """The courier API failed with a 5xx response."""
+
+    retryable = True
+
+
+class CourierTimeoutError(CourierApiError):
+    """The request did not complete in time."""
+
+    retryable = True
+
+
+class CourierConnectionError(CourierApiError):
+    """The courier API could not be reached."""
+
+    retryable = True
+
+
+def _error_class_for_status(status: int) -> type[CourierApiError]:
+    if status == 401:
+        return CourierAuthError
+    if status == 429:
+        return CourierRateLimitError
+    if status >= 500:
+        return CourierServerError
+    return CourierApiError
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _request_key(method, url, params):
+    """Return a hashable key identifying a request by method, URL and query."""
+    if params:
+        return (method.upper(), url, tuple(sorted((str(k), str(v)) for k, v in params.items())))
+    return (method.upper(), url, ())
+
+
+class ValidatorCache:
+    """Remember ETag / Last-Modified validators per request URL for one account."""
+
+    def __init__(self):
+        self._validators = {}
+
+    _key = staticmethod(_request_key)
+
+    def apply(self, method, url, params, headers: dict) -> bool:
+        """Add conditional headers for a cached URL. Returns True when any were added."""
+        validators = self._validators.get(self._key(method, url, params))
+        if not validators:
+            return False
+        etag, last_modified = validators
+        if etag:
+            headers.setdefault("If-None-Match", etag)
+        if last_modified:
+            headers.setdefault("If-Modified-Since", last_modified)
+        return True
+
+    def store(self, method, url, params, resp) -> None:
+        """Store validators from a successful response, dropping stale ones."""
+        key = self._key(method, url, params)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators[key] = (etag, last_modified)
+        else:
+            self._validators.pop(key, None)
+
+    def clear(self) -> None:
+        self._validators.clear()
+
+
+_ID_SEGMENT = re.compile(r"\d")
+_VERSION_SEGMENT = re.compile(r"v\d+(?:\.\d+)*")
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent identical requests of an account."""
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, func):
+        """Await ``func()``, joining an identical call that is already running."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            _LOGGER.debug("Joining in-flight request %s %s", key[0], key[1])
+        # Shield so one caller cancelling does not cancel the shared request.
+        return await asyncio.shield(task)
+
+    def _forget(self, key, task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every waiter was cancelled.
+            task.exception()
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """Return a stable endpoint name with parcel numbers and ids collapsed."""
+    path = urllib.parse.urlsplit(url).path
+    segments = [
+        "{id}" if _ID_SEGMENT.search(segment) and not _VERSION_SEGMENT.fullmatch(segment) else segment
+        for segment in path.split("/")
+    ]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+async def _decode_body(body: bytes, decoder, endpoint: str, metrics=None):
+    """Decode a JSON body, offloading large ones to the executor."""
+    offload = len(body) > EXECUTOR_DECODE_THRESHOLD
+    start = time.perf_counter()
+    try:
+        if offload:
+            return await asyncio.get_running_loop().run_in_executor(None, decoder, body)
+        return decoder(body)
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if metrics is not None:
+            metrics.record_decode(endpoint, elapsed_ms, offload)
+        _LOGGER.debug(
+            "Decoded %d bytes from %s in %.2f ms%s",
+            len(body),
+            endpoint,
+            elapsed_ms,
+            " (executor)" if offload else "",
+        )
+
 
 async def request_json(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    *,
+    single_flight: SingleFlight | None = None,
+    **kwargs,
+):
+    """
+    Perform a request through _request_json.
+
+    GET requests with a single-flight group share one in-flight call per
+    URL and query, so concurrent identical calls hit the API only once.
+    """
+    if single_flight is not None and method.upper() == "GET":
+        key = _request_key(method, url, kwargs.get("params"))
+        return await single_flight.do(key, lambda: _request_json(session, method, url, **kwargs))
+    return await _request_json(session, method, url, **kwargs)
+
+
+async def _request_json(
     session: aiohttp.ClientSession,
     method: str,
     url: str,
@@ -24,16 +246,34 @@ async def request_json(
     log_401_as_info: bool = False,
     error_with_text: bool = True,
     on_response=None,
+    validator_cache: ValidatorCache | None = None,
+    decoder=None,
+    metrics=None,
 ):
     """
     Perform a request, parse JSON when possible, and apply consistent error handling.
 
     Returns parsed JSON when available, otherwise the raw response text.
+    When a validator cache is given, the request is made conditional and
+    NOT_MODIFIED is returned if the server answers 304.
+    The body is read once as bytes and decoded with ``decoder``
+    (orjson when available, stdlib json otherwise).
+    Latency, status, size, timeouts and decode time are recorded in
+    ``metrics`` if given.
     """
-    if headers is None:
-        headers = {}
+    if decoder is None:
+        decoder = json_loads
+    headers = dict(headers) if headers else {}
+    conditional = False
+    if validator_cache is not None:
+        conditional = validator_cache.apply(method, url, params, headers)
     api_label = f"{label} API"
     error_label = f"{api_label} Error"
+    endpoint = endpoint_key(method, url)
+    status = None
+    size = 0
+    timed_out = False
+    start = time.monotonic()
 
     try:
         async with async_timeout.timeout(timeout):
@@ -48,28 +288,139 @@ async def request_json(
                 kwargs["data"] = data
 
             async with session.request(method, url, **kwargs) as resp:
+                status = resp.status
                 if on_response:
                     on_response(resp)
 
-                text = await resp.text()
+                if resp.status == 304 and conditional:
+                    return NOT_MODIFIED
+
+                body = await resp.read()
+                size = len(body)
                 if resp.status >= 400:
+                    text = _body_text(resp, body)
                     if resp.status == 401 and log_401_as_info:
                         _LOGGER.info("%s error %s: %s", label, resp.status, text)
                     else:
                         _LOGGER.error("%s error %s: %s", label, resp.status, text)
+                    error_class = _error_class_for_status(resp.status)
+                    retry_after = parse_retry_after(resp.headers.get("Retry-After"))
                     if error_with_text:
-                        raise Exception(f"{error_label}: {resp.status} - {text}")
-                    raise Exception(f"{error_label}: {resp.status}")
+                        message = f"{error_label}: {resp.status} - {text}"
+                    else:
+                        message = f"{error_label}: {resp.status}"
+                    raise error_class(message, status=resp.status, retry_after=retry_after)
+                if validator_cache is not None:
+                    validator_cache.store(method, url, params, resp)
                 try:
-                    return json.loads(text)
+                    return await _decode_body(body, decoder, endpoint, metrics)
                 except Exception:
-                    return text
-    except asyncio.TimeoutError:
+                    return _body_text(resp, body)
+    except asyncio.TimeoutError as err:
+        timed_out = True
         _LOGGER.error("%s request to %s timed out", api_label, url)
-        raise Exception(f"{api_label} request timed out")
+        raise CourierTimeoutError(f"{api_label} request timed out") from err
     except aiohttp.ClientError as err:
         _LOGGER.error("%s client error: %s", api_label, err)
-        raise Exception(f"{api_label} client error: {err}")
+        raise CourierConnectionError(f"{api_label} client error: {err}") from err
+    finally:
+        if metrics is not None:
+            metrics.record_request(endpoint, time.monotonic() - start, status, size, timed_out)
+
+
+def _body_text(resp, body: bytes) -> str:
+    """Decode a raw body to text using the response charset."""
+    return body.decode(resp.charset or "utf-8", errors="replace")
+
+
+def page_count(data) -> int:
+    """Return the ``totalPages`` announced by a paged response, or 1."""
+    if not isinstance(data, dict):
+        return 1
+    try:
+        return max(1, int(data.get("totalPages") or 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+# Keys that may state the page size of a paged response.
+_PAGE_SIZE_KEYS = ("pageSize", "size", "limit")
+
+
+def _page_size(data) -> int | None:
+    if isinstance(data, dict):
+        for key in _PAGE_SIZE_KEYS:
+            try:
+                size = int(data.get(key) or 0)
+            except (TypeError, ValueError):
+                continue
+            if size > 0:
+                return size
+    return None
+
+
+async def iter_pages(
+    first,
+    fetch_page,
+    *,
+    first_page: int = 1,
+    concurrency: int = PAGE_FETCH_CONCURRENCY,
+    count_items=None,
+):
+    """Yield ``first`` and then the remaining pages it announces, in order.
+
+    Later pages are fetched concurrently, at most ``concurrency`` at a time,
+    and each is yielded as soon as it and all pages before it are available.
+    If the first page does not announce ``totalPages`` and ``count_items`` is
+    given, pages are instead fetched one by one while they come back full.
+    """
+    yield first
+    if count_items is not None and not (isinstance(first, dict) and "totalPages" in first):
+        async for page in _probe_pages(first, fetch_page, first_page, count_items):
+            yield page
+        return
+
+    total = page_count(first)
+    if total > MAX_PAGES:
+        _LOGGER.warning("Paged list announces %d pages, fetching only the first %d", total, MAX_PAGES)
+        total = MAX_PAGES
+    if total <= 1:
+        return
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _fetch(page):
+        async with semaphore:
+            return await fetch_page(page)
+
+    tasks = [asyncio.ensure_future(_fetch(page)) for page in range(first_page + 1, first_page + total)]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Retrieve every outcome so failed pages are not logged as never retrieved.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _probe_pages(first, fetch_page, first_page: int, count_items):
+    """Yield the pages after ``first`` until one comes back short or empty."""
+    full_size = _page_size(first) or count_items(first)
+    if not full_size or count_items(first) < full_size:
+        return
+    previous = first
+    for page_number in range(first_page + 1, first_page + MAX_PAGES):
+        page = await fetch_page(page_number)
+        items = count_items(page)
+        if not items or page == previous:
+            # Past the end, or the server ignores the page number.
+            return
+        yield page
+        if items < full_size:
+            return
+        previous = page
+    _LOGGER.warning("Paged list still full after %d pages, stopping", MAX_PAGES)
 
 
 def normalize_phone(phone: str) -> str:
@@ -1,18 +1,22 @@
 import aiohttp
 import urllib.parse
-from .api_helpers import normalize_phone, request_json
+from .api_helpers import SingleFlight, ValidatorCache, normalize_phone, request_json
 
 
 class InPostApi:
     BASE_URL = "https://api-inmobile-pl.easypack24.net"
+    PREWARM_URL = BASE_URL
 
     def __init__(self, session: aiohttp.ClientSession, device_uid: str | None = None):
         self._session = session
         self._token = None
         self._refresh_token = None
         self._device_uid = device_uid
+        self._validators = ValidatorCache()
+        self._inflight = SingleFlight()
+        self.metrics = None
 
-    async def request(self, method, path, data=None, headers=None):
+    async def request(self, method, path, data=None, headers=None, conditional: bool = False):
         if headers is None:
             headers = {}
 
@@ -39,6 +43,9 @@ class InPostApi:
             label="InPost",
             log_401_as_info=True,
             error_with_text=True,
+            validator_cache=self._validators if conditional else None,
+            single_flight=self._inflight,
+            metrics=self.metrics,
         )
 
     async def send_sms_code(self, phone_number):
@@ -87,7 +94,7 @@ class InPostApi:
         return data
 
     async def get_parcels(self):
-        return await self.request("GET", "v4/parcels/tracked")
+        return await self.request("GET", "v4/parcels/tracked", conditional=True)
 
     async def get_parcel(self, shipment_number: str):
         encoded = urllib.parse.quote(str(shipment_number), safe="")
@@ -5,7 +5,7 @@ import secrets
 import time
 import urllib.parse
 
-from .api_helpers import request_json
+from .api_helpers import SingleFlight, ValidatorCache, iter_pages, page_count, request_json
 
 """
 Authorization is basically:
@@ -16,6 +16,7 @@ Authorization is basically:
 """
 class PocztexApi:
     API_BASE_URL = "https://aplikacja.pocztex.pl/api/customer"
+    PREWARM_URL = API_BASE_URL
     AUTH_BASE_URL = "https://idm.pocztex.pl"
     AUTH_REALM = "ppsa"
     CLIENT_ID = "mobile"
@@ -36,6 +37,11 @@ class PocztexApi:
         self._refresh_token = None
         self._expires_at = 0
         self._refresh_expires_at = 0
+        self._validators = ValidatorCache()
+        self._inflight = SingleFlight()
+        self.metrics = None
+        # Optional coroutine used instead of refresh_token to serialise refreshes.
+        self.token_refresher = None
 
     def _token_url(self):
         base = self.AUTH_BASE_URL.rstrip("/")
@@ -70,6 +76,7 @@ class PocztexApi:
             label="Pocztex",
             log_401_as_info=True,
             error_with_text=True,
+            metrics=self.metrics,
         )
 
     def _parse_login_form(self, html_text):
@@ -217,10 +224,13 @@ class PocztexApi:
         self._save_token_data(token_data)
         return token_data
 
-    async def request(self, method, path, params=None):
+    async def request(self, method, path, params=None, conditional: bool = False):
         # Refresh token if about to expire
         if self._token and self._expires_at and time.time() > self._expires_at - 60:
-            await self.refresh_token()
+            if self.token_refresher is not None:
+                await self.token_refresher()
+            else:
+                await self.refresh_token()
 
         base = self.API_BASE_URL.rstrip("/")
         url = f"{base}/{path.lstrip('/')}"
@@ -245,10 +255,28 @@ class PocztexApi:
             label="Pocztex",
             log_401_as_info=False,
             error_with_text=True,
+            validator_cache=self._validators if conditional else None,
+            single_flight=self._inflight,
+            metrics=self.metrics,
         )
 
     async def get_parcels(self):
-        return await self.request("GET", "/tracking")
+        data = await self.request("GET", "/tracking", conditional=True)
+        if page_count(data) > 1:
+            # A 304 for the first page says nothing about the other pages.
+            self._validators.clear()
+        return data
+
+    async def get_parcels_page(self, page: int, size: int | None = None):
+        params = {"page": page}
+        if size:
+            params["size"] = size
+        return await self.request("GET", "/tracking", params=params)
+
+    def iter_parcel_pages(self, first):
+        """Yield the first (Spring-style, 0-based) list page and then the remaining ones."""
+        size = first.get("size") if isinstance(first, dict) else None
+        return iter_pages(first, lambda page: self.get_parcels_page(page, size), first_page=0)
 
     async def get_parcel_details(self, tracking_id):
         if tracking_id is None:
@@ -0,0 +1,163 @@
+"""Append-only on-disk archive of parcels that finished tracking."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import timedelta
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .api_helpers import json_loads
+from .const import DOMAIN
+from .models import ParcelRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ARCHIVE = "_archive"
+
+# Retention: keep at most this many parcels, none older than the max age.
+ARCHIVE_MAX_ENTRIES = 1000
+ARCHIVE_MAX_AGE = timedelta(days=365)
+# Compact once the file holds this many lines more than the entry limit.
+ARCHIVE_COMPACT_SLACK = 250
+
+# Payload keys not worth keeping on disk.
+_DROPPED_KEYS = ("_raw_response",)
+
+
+def _archive_line(entry: ConfigEntry, courier: str, record: ParcelRecord, archived_at: str) -> str:
+    payload = {key: value for key, value in record.payload.items() if key not in _DROPPED_KEYS}
+    return json.dumps(
+        {
+            "archived_at": archived_at,
+            "entry_id": entry.entry_id,
+            "courier": courier,
+            "id": record.id,
+            "status_key": record.status_key,
+            "status_raw": record.raw_status,
+            "payload": payload,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+class ParcelArchive:
+    """Bounded JSON Lines file of delivered, returned and cancelled parcels."""
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the archive."""
+        self.hass = hass
+        self.path = path
+        self._lock = asyncio.Lock()
+        self._line_count: int | None = None
+
+    @callback
+    def async_append(self, entry: ConfigEntry, courier: str, records: Iterable[ParcelRecord]) -> None:
+        """Archive parcels that just left the active set."""
+        archived_at = dt_util.utcnow().isoformat()
+        lines = [_archive_line(entry, courier, record, archived_at) for record in records]
+        if lines:
+            self.hass.async_create_background_task(
+                self._async_write(lines), f"{DOMAIN} archive {courier}"
+            )
+
+    async def _async_write(self, lines: list[str]) -> None:
+        async with self._lock:
+            try:
+                if self._line_count is None:
+                    self._line_count = await self.hass.async_add_executor_job(self._count_lines)
+                await self.hass.async_add_executor_job(self._append_lines, lines)
+                self._line_count += len(lines)
+                if self._line_count > ARCHIVE_MAX_ENTRIES + ARCHIVE_COMPACT_SLACK:
+                    self._line_count = await self.hass.async_add_executor_job(self._compact)
+            except OSError as err:
+                _LOGGER.warning("Failed to write parcel archive %s: %s", self.path, err)
+
+    async def async_query(
+        self,
+        *,
+        courier: str | None = None,
+        entry_id: str | None = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        """Return one page of archived parcels, newest first."""
+        async with self._lock:
+            items = await self.hass.async_add_executor_job(self._read_items)
+        cutoff = (dt_util.utcnow() - ARCHIVE_MAX_AGE).isoformat()
+        matching = [
+            item
+            for item in reversed(items)
+            if (courier is None or item.get("courier") == courier)
+            and (entry_id is None or item.get("entry_id") == entry_id)
+            and str(item.get("archived_at") or "") >= cutoff
+        ]
+        return {
+            "total": len(matching),
+            "offset": offset,
+            "limit": limit,
+            "items": matching[offset : offset + limit],
+        }
+
+    def _count_lines(self) -> int:
+        try:
+            with open(self.path, "rb") as file:
+                return sum(1 for _ in file)
+        except FileNotFoundError:
+            return 0
+
+    def _append_lines(self, lines: list[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def _read_items(self) -> list[dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as file:
+                raw_lines = file.read().splitlines()
+        except FileNotFoundError:
+            return []
+        items = []
+        for raw_line in raw_lines:
+            if not raw_line.strip():
+                continue
+            try:
+                item = json_loads(raw_line)
+            except ValueError:
+                # A torn write from a crash; skip it.
+                continue
+            if isinstance(item, dict):
+                items.append(item)
+        return items
+
+    def _compact(self) -> int:
+        """Rewrite the file within the retention limits; return the line count."""
+        cutoff = (dt_util.utcnow() - ARCHIVE_MAX_AGE).isoformat()
+        items = [
+            item for item in self._read_items() if str(item.get("archived_at") or "") >= cutoff
+        ][-ARCHIVE_MAX_ENTRIES:]
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for item in items:
+                file.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, self.path)
+        return len(items)
+
+
+@callback
+def async_get_archive(hass: HomeAssistant) -> ParcelArchive:
+    """Return the domain-wide parcel archive."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    archive = domain_data.get(DATA_ARCHIVE)
+    if archive is None:
+        archive = domain_data[DATA_ARCHIVE] = ParcelArchive(
+            hass, hass.config.path(".storage", f"{DOMAIN}.archive.jsonl")
+        )
+    return archive
@@ -12,7 +12,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_EMAIL, CONF_PHONE, DOMAIN, INTEGRATION_VERSION
 from .coordinator import ShipmentCoordinator
-from .helpers import get_parcel_id, is_delivered
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,28 +23,37 @@ async def async_setup_entry(
 ) -> None:
     """Set up button entities from a config entry."""
     coordinator: ShipmentCoordinator = hass.data[DOMAIN][entry.entry_id]
+    has_initialized = False
+    # Parcels whose buttons belong to this account; the rest are re-checked on
+    # every update in case the owning account drops them.
+    handled_ids: set[str] = set()
 
     @callback
     def async_update_buttons() -> None:
         """Add new parcel refresh buttons and remove old ones."""
+        nonlocal has_initialized
+        delta = coordinator.last_delta
+        current_ids = set(coordinator.parcels_by_id)
+        pending_ids = current_ids - handled_ids
+        if has_initialized and not (pending_ids or delta.removed):
+            return
+
         registry = async_get_entity_registry(hass)
-        current_data = coordinator.data or []
 
         refresh_all_unique_id = _get_refresh_all_unique_id(coordinator)
         refresh_all_entity_id = registry.async_get_entity_id("button", DOMAIN, refresh_all_unique_id)
         if _should_add_runtime_entity(hass, registry, entry, refresh_all_entity_id):
             async_add_entities([RefreshAllShipmentsButton(coordinator)])
 
-        current_ids = set()
+        candidate_ids = []
         new_buttons = []
-        for parcel in current_data:
-            pid = get_parcel_id(parcel, coordinator.courier)
-            if not pid or is_delivered(parcel, coordinator.courier):
-                continue
-
-            current_ids.add(pid)
+        for pid in pending_ids:
             unique_id = _get_refresh_unique_id(coordinator.courier, pid)
             existing_entity_id = registry.async_get_entity_id("button", DOMAIN, unique_id)
+            if _is_owned_by_other_entry(registry, entry, existing_entity_id):
+                continue
+            handled_ids.add(pid)
+            candidate_ids.append(pid)
             if not _should_add_runtime_entity(hass, registry, entry, existing_entity_id):
                 continue
 
@@ -53,10 +61,13 @@ async def async_setup_entry(
 
         if new_buttons:
             async_add_entities(new_buttons)
+            coordinator.entity_index.async_add(
+                "button", [button.unique_id for button in new_buttons]
+            )
 
         if coordinator.courier == "dpd":
             manage_buttons = []
-            for pid in current_ids:
+            for pid in candidate_ids:
                 unique_id = _get_manage_unique_id(coordinator.courier, pid)
                 existing_entity_id = registry.async_get_entity_id("button", DOMAIN, unique_id)
                 if not _should_add_runtime_entity(hass, registry, entry, existing_entity_id):
@@ -65,13 +76,19 @@ async def async_setup_entry(
 
             if manage_buttons:
                 async_add_entities(manage_buttons)
-
-        _async_remove_old_parcel_buttons(
-            hass,
-            entry,
-            coordinator,
-            current_ids,
-        )
+                coordinator.entity_index.async_add(
+                    "button", [button.unique_id for button in manage_buttons]
+                )
+
+        if delta.removed or not has_initialized:
+            _async_remove_old_parcel_buttons(
+                hass,
+                entry,
+                coordinator,
+                current_ids,
+            )
+        handled_ids.intersection_update(current_ids)
+        has_initialized = True
 
     entry.async_on_unload(coordinator.async_add_listener(async_update_buttons))
     async_update_buttons()
@@ -84,25 +101,25 @@ def _async_remove_old_parcel_buttons(
     current_ids: set[str],
 ) -> None:
     """Remove per-parcel buttons that no longer match active shipments."""
-    registry = async_get_entity_registry(hass)
     current_unique_ids = {_get_refresh_unique_id(coordinator.courier, pid) for pid in current_ids}
     if coordinator.courier == "dpd":
         current_unique_ids |= {_get_manage_unique_id(coordinator.courier, pid) for pid in current_ids}
 
-    entities_to_remove = []
-    for entity_entry in registry.entities.values():
-        unique_id = entity_entry.unique_id or ""
-        if (
-            entity_entry.platform == DOMAIN
-            and entity_entry.config_entry_id == entry.entry_id
-            and entity_entry.entity_id.startswith("button.")
-            and (unique_id.endswith("_refresh") or unique_id.endswith("_manage"))
-            and unique_id not in current_unique_ids
-        ):
-            entities_to_remove.append(entity_entry.entity_id)
+    def is_current(unique_id: str) -> bool:
+        return (
+            not (unique_id.endswith("_refresh") or unique_id.endswith("_manage"))
+            or unique_id in current_unique_ids
+        )
+
+    coordinator.entity_index.async_remove_stale("button", is_current)
+
 
-    for entity_id in entities_to_remove:
-        registry.async_remove(entity_id)
+def _is_owned_by_other_entry(registry, entry: ConfigEntry, entity_id: str | None) -> bool:
+    """Return True if the entity is registered to another account."""
+    if entity_id is None:
+        return False
+    existing = registry.async_get(entity_id)
+    return existing is not None and existing.config_entry_id != entry.entry_id
 
 
 def _should_add_runtime_entity(
@@ -115,8 +132,7 @@ def _should_add_runtime_entity(
     if entity_id is None:
         return True
 
-    existing = registry.async_get(entity_id)
-    if existing and existing.config_entry_id != entry.entry_id:
+    if _is_owned_by_other_entry(registry, entry, entity_id):
         # Another account already owns this unique ID.
         return False
 
@@ -3,6 +3,7 @@ import uuid
 import json
 import logging
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
@@ -16,6 +17,14 @@ from .const import (
     CONF_TOKEN_EXPIRES_AT,
     CONF_REFRESH_EXPIRES_AT,
     CONF_DEVICE_UID,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_PREWARM_CONNECTIONS,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_PREWARM_CONNECTIONS,
+    CONF_BATCH_EVENTS,
+    DEFAULT_BATCH_EVENTS,
 )
 from .api_helpers import normalize_phone
 
@@ -33,6 +42,11 @@ class ShipmentTrackingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.temp_data = {}
         self.device_uid = uuid.uuid4().hex
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return ShipmentTrackingOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         errors = {}
         
@@ -191,3 +205,46 @@ class ShipmentTrackingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders={"phone": self.phone}
         )
+
+
+class ShipmentTrackingOptionsFlow(config_entries.OptionsFlow):
+    """Polling options for a shipment tracking account."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        # OptionsFlow.config_entry only exists from Home Assistant 2024.11 and
+        # must not be assigned there, so keep our own reference.
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        errors = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_POLL_INTERVAL] > user_input[CONF_MAX_POLL_INTERVAL]:
+                errors["base"] = "invalid_poll_bounds"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(
+                    CONF_MIN_POLL_INTERVAL,
+                    default=options.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Required(
+                    CONF_MAX_POLL_INTERVAL,
+                    default=options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Required(
+                    CONF_PREWARM_CONNECTIONS,
+                    default=options.get(CONF_PREWARM_CONNECTIONS, DEFAULT_PREWARM_CONNECTIONS),
+                ): bool,
+                vol.Required(
+                    CONF_BATCH_EVENTS,
+                    default=options.get(CONF_BATCH_EVENTS, DEFAULT_BATCH_EVENTS),
+                ): bool,
+            }),
+            errors=errors,
+        )
@@ -15,6 +15,33 @@ CONF_TOKEN_EXPIRES_AT = "token_expires_at"
 CONF_REFRESH_EXPIRES_AT = "refresh_expires_at"
 CONF_DEVICE_UID = "device_uid"
 
+# --- Options ---
+CONF_PREWARM_CONNECTIONS = "prewarm_connections"
+DEFAULT_PREWARM_CONNECTIONS = False
+# Seconds before a scheduled poll at which courier connections are opened.
+PREWARM_LEAD_SECONDS = 20
+# Adaptive polling bounds in minutes.
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+DEFAULT_MIN_POLL_INTERVAL = 5
+DEFAULT_MAX_POLL_INTERVAL = 120
+# Fire one bulk event per refresh instead of one event per parcel.
+CONF_BATCH_EVENTS = "batch_events"
+DEFAULT_BATCH_EVENTS = False
+
+# --- Single parcel refresh ---
+# Seconds to collect refresh requests before fetching them as one batch.
+PARCEL_REFRESH_DEBOUNCE = 1.0
+SINGLE_REFRESH_CONCURRENCY = 4
+
+# --- Events ---
+# Events held until Home Assistant has started; the oldest are dropped beyond this.
+MAX_PENDING_EVENTS = 200
+
+# --- Services ---
+SERVICE_REFRESH_PARCELS = "refresh_parcels"
+ATTR_TRACKING_NUMBERS = "tracking_numbers"
+
 # --- Frontend registration constants ---
 _MANIFEST_PATH: Final[Path] = Path(__file__).parent / "manifest.json"
 
@@ -1,13 +1,19 @@
+from dataclasses import dataclass, field
 from datetime import timedelta
 import asyncio
+import itertools
 import logging
 import json
 import time
+from urllib.parse import urlparse
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -17,12 +23,50 @@ from .const import (
     CONF_REFRESH_EXPIRES_AT,
     CONF_COURIER,
     CONF_DEVICE_UID,
+    CONF_PREWARM_CONNECTIONS,
+    DEFAULT_PREWARM_CONNECTIONS,
+    PREWARM_LEAD_SECONDS,
+    PARCEL_REFRESH_DEBOUNCE,
+    SINGLE_REFRESH_CONCURRENCY,
 )
+from .api_helpers import NOT_MODIFIED, CourierAuthError
+from .archive import async_get_archive
+from .entity_index import EntityIndex
+from .metrics import ApiMetrics
+from .resilience import (
+    CircuitOpenError,
+    async_get_concurrency_limiter,
+    async_get_courier_policy,
+    async_remove_courier_policy,
+)
+from .scheduler import async_get_poll_scheduler, compute_poll_interval, get_poll_bounds
+from .session_manager import async_get_session_manager
+from .state_store import ParcelStateStore
+from .token_manager import TokenRefreshManager, decode_jwt_expiry
 from .helpers import get_parcel_detail_id, get_parcel_id
-from .helpers import is_delivered
+from .models import ParcelRecord
+from .parcel_registry import async_get_parcel_registry
 
 _LOGGER = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class ParcelDelta:
+    """Parcel ids added, removed and changed by the latest coordinator update."""
+
+    added: frozenset[str] = field(default_factory=frozenset)
+    removed: frozenset[str] = field(default_factory=frozenset)
+    changed: frozenset[str] = field(default_factory=frozenset)
+    # (old, new) records of changed parcels whose status key changed.
+    status_changes: tuple[tuple[ParcelRecord, ParcelRecord], ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+EMPTY_DELTA = ParcelDelta()
+
+
 class ShipmentCoordinator(DataUpdateCoordinator):
     """Class to manage fetching shipment data."""
 
@@ -32,6 +76,30 @@ class ShipmentCoordinator(DataUpdateCoordinator):
         self.courier = entry.data[CONF_COURIER]
         self.known_parcels = set()
         self.add_entities_callback = None
+        # Active parcels by id in coordinator order, and what the last update changed.
+        self.parcels_by_id: dict[str, ParcelRecord] = {}
+        self.last_delta: ParcelDelta = EMPTY_DELTA
+        # Bumped whenever a parcel's payload changes; keys the encoded payload cache.
+        self.payload_versions: dict[str, int] = {}
+        self._version_counter = itertools.count(1)
+        self._encoded_payloads: dict[str, tuple[int, bytes]] = {}
+        # Last fetched (enriched, unfiltered) parcel list, reused on 304 responses.
+        self._last_parcels = None
+        # Pocztex list payloads before enrichment, re-enriched on 304 responses.
+        self._last_listed = None
+        # Set when a detail fetch failed during the current enrichment.
+        self._partial_enrichment = False
+        self._unsub_prewarm = None
+        self.parcel_registry = async_get_parcel_registry(hass)
+        # Shared with every account of this courier, see ParcelRegistry.
+        self.detail_cache = self.parcel_registry.detail_cache(self.courier)
+        self.state_store = ParcelStateStore(hass, entry)
+        self.archive = async_get_archive(hass)
+        self.entity_index = EntityIndex(hass, entry.entry_id)
+        # When the displayed parcels were last fetched from the courier, and
+        # whether they still come from the persisted cache.
+        self.last_success_at = None
+        self.data_from_cache = False
         
         super().__init__(
             hass,
@@ -40,8 +108,34 @@ class ShipmentCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(minutes=15),
         )
         
-        self.session = async_get_clientsession(hass)
+        self.policy = async_get_courier_policy(hass, self.courier, entry.entry_id)
+        self.scheduler = async_get_poll_scheduler(hass)
+        self.scheduler.async_register(entry.entry_id)
+        # Interval picked from parcel statuses; update_interval adds the stagger.
+        self.base_interval = self.update_interval
+        self.session_manager = async_get_session_manager(hass)
+        self.session = self.session_manager.async_get_session(self.courier)
+        self.metrics = ApiMetrics()
         self.api = self._get_api_instance()
+        if self.api is not None:
+            self.api.metrics = self.metrics
+        # Detail fan-out concurrency adapts to how much the courier host takes.
+        detail_host = urlparse(getattr(self.api, "PREWARM_URL", "") or "").netloc
+        self.detail_limiter = async_get_concurrency_limiter(hass, detail_host or self.courier)
+        self.token_manager = TokenRefreshManager(
+            hass, self.courier, self._refresh_token, self._get_token_expiry
+        )
+        if hasattr(self.api, "token_refresher"):
+            self.api.token_refresher = self.token_manager.async_ensure_valid
+        # Single-parcel refresh requests collected for the next batch.
+        self._pending_refresh: set[str] = set()
+        self._parcel_refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PARCEL_REFRESH_DEBOUNCE,
+            immediate=False,
+            function=self._async_refresh_pending_parcels,
+        )
 
     def _get_api_instance(self):
         """Get API instance based on courier."""
@@ -91,39 +185,213 @@ class ShipmentCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self):
         """Fetch data from API."""
+        start = time.monotonic()
+        success = False
+        # Listeners also run after failed updates; they must not see a stale delta.
+        self.last_delta = EMPTY_DELTA
         try:
-            parcels = await self._fetch_parcels_with_retry()
-            return self._filter_active_parcels(parcels)
+            async with self.scheduler.async_slot(self.courier):
+                parcels = await self._fetch_parcels_with_retry()
+            self._last_parcels = parcels
+            success = True
+            active = self._index_parcels(self._filter_active_parcels(parcels))
+            self._archive_finished(parcels, self.last_delta.removed)
+            self._adapt_update_interval(active)
+            # The first poll after a restore confirms the cache; save it once.
+            confirms_cache = self.data_from_cache
+            self.data_from_cache = False
+            self._persist(active, force=confirms_cache)
+            return active
+        except CircuitOpenError as err:
+            _LOGGER.debug("Skipping %s refresh: %s", self.courier, err)
+            raise UpdateFailed(str(err)) from err
         except Exception as err:
             _LOGGER.error("Error fetching data for %s: %s", self.courier, err)
             raise UpdateFailed(f"Error communicating with API: {err}")
+        finally:
+            self.metrics.record_refresh(time.monotonic() - start, success)
+            self._schedule_next_poll()
+
+    def _schedule_next_poll(self) -> None:
+        """Set the delay until the next poll and schedule the work ahead of it."""
+        self.update_interval = self.scheduler.next_poll_delay(self.entry.entry_id, self.base_interval)
+        self._schedule_prewarm()
+        if self.update_interval is not None:
+            self.token_manager.async_schedule(self.update_interval.total_seconds())
+
+    async def async_hydrate(self) -> bool:
+        """Load the persisted parcel list as initial data.
+
+        Returns True if cached parcels were restored, in which case the first
+        network refresh can run in the background.
+        """
+        parcels, saved_at = await self.state_store.async_load()
+        if not parcels:
+            return False
+        records = self._index_parcels(self._filter_active_parcels(parcels))
+        self.last_delta = EMPTY_DELTA
+        self.data = records
+        self.last_update_success = True
+        self.last_success_at = saved_at
+        self.data_from_cache = True
+        self._adapt_update_interval(records)
+        _LOGGER.debug("Restored %d cached %s parcels from %s", len(records), self.courier, saved_at)
+        return True
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True if the data was not confirmed by the latest poll."""
+        return self.data_from_cache or not self.last_update_success
+
+    def _archive_finished(self, parcels, removed: frozenset[str]) -> None:
+        """Archive parcels that left the active set because they finished."""
+        if not removed or not isinstance(parcels, list):
+            return
+        finished = []
+        for parcel in parcels:
+            if not isinstance(parcel, dict):
+                continue
+            record = ParcelRecord.from_payload(parcel, self.courier)
+            if record.id in removed and record.delivered:
+                finished.append(record)
+        self.archive.async_append(self.entry, self.courier, finished)
+
+    def _persist(self, records: list[ParcelRecord], force: bool = False) -> None:
+        """Remember the active parcels for the next startup, if they changed."""
+        self.last_success_at = dt_util.utcnow()
+        if self.last_delta or force:
+            self.state_store.async_save([record.payload for record in records], self.last_success_at)
+
+    def get_parcel(self, parcel_id: str) -> ParcelRecord | None:
+        """Return the active parcel with the given id."""
+        return self.parcels_by_id.get(str(parcel_id))
+
+    def get_encoded_payload(self, parcel_id: str) -> bytes | None:
+        """Return the parcel's raw courier payload encoded as JSON.
+
+        The encoding is cached until the payload version changes, so repeated
+        requests from the card do not re-serialize large payloads.
+        """
+        record = self.get_parcel(parcel_id)
+        if record is None:
+            return None
+        version = self.payload_versions.get(record.id, 0)
+        cached = self._encoded_payloads.get(record.id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        payload = record.payload
+        raw = payload["_raw_response"] if "_raw_response" in payload else payload
+        encoded = json_bytes({"version": version, "payload": raw})
+        self._encoded_payloads[record.id] = (version, encoded)
+        return encoded
+
+    def _index_parcels(self, records: list[ParcelRecord]) -> list[ParcelRecord]:
+        """Rebuild the id index from new coordinator data and record the delta."""
+        index: dict[str, ParcelRecord] = {}
+        for record in records:
+            index.setdefault(record.id, record)
+
+        previous = self.parcels_by_id
+        changed = frozenset(
+            parcel_id
+            for parcel_id, record in index.items()
+            if parcel_id in previous
+            and previous[parcel_id].payload is not record.payload
+            and previous[parcel_id].payload != record.payload
+        )
+        self.last_delta = ParcelDelta(
+            added=frozenset(index.keys() - previous.keys()),
+            removed=frozenset(previous.keys() - index.keys()),
+            changed=changed,
+            status_changes=tuple(
+                (previous[parcel_id], index[parcel_id])
+                for parcel_id in changed
+                if previous[parcel_id].status_key != index[parcel_id].status_key
+            ),
+        )
+        for parcel_id in self.last_delta.added | self.last_delta.changed:
+            self.payload_versions[parcel_id] = next(self._version_counter)
+        for parcel_id in self.last_delta.removed:
+            self.payload_versions.pop(parcel_id, None)
+            self._encoded_payloads.pop(parcel_id, None)
+        self.parcels_by_id = index
+        self.parcel_registry.async_set_parcels(self, index)
+        return list(index.values())
+
+    def _adapt_update_interval(self, records: list[ParcelRecord]) -> None:
+        """Poll faster while parcels are close to delivery, slower when idle."""
+        status_keys = [record.status_key for record in records]
+        interval = compute_poll_interval(status_keys, *get_poll_bounds(self.entry))
+        if interval != self.base_interval:
+            _LOGGER.debug("%s poll interval set to %s", self.courier, interval)
+            self.base_interval = interval
+
+    def _get_token_expiry(self) -> float | None:
+        """Return when the current access token expires, if known."""
+        if self.api is None:
+            return None
+        if self.courier in ("dpd", "pocztex"):
+            return self.api._expires_at or None
+        return decode_jwt_expiry(self.api._token)
+
+    def _schedule_prewarm(self) -> None:
+        """Open courier connections shortly before the next scheduled poll."""
+        if self._unsub_prewarm:
+            self._unsub_prewarm()
+            self._unsub_prewarm = None
+        if not self.entry.options.get(CONF_PREWARM_CONNECTIONS, DEFAULT_PREWARM_CONNECTIONS):
+            return
+        prewarm_url = getattr(self.api, "PREWARM_URL", None)
+        if not prewarm_url or self.update_interval is None:
+            return
+        delay = self.update_interval.total_seconds() - PREWARM_LEAD_SECONDS
+        if delay <= 0:
+            return
+
+        async def _async_prewarm(_now) -> None:
+            self._unsub_prewarm = None
+            await self.session_manager.async_prewarm(self.courier, prewarm_url)
+
+        self._unsub_prewarm = async_call_later(self.hass, delay, _async_prewarm)
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled work when the config entry unloads."""
+        if self._unsub_prewarm:
+            self._unsub_prewarm()
+            self._unsub_prewarm = None
+        self.token_manager.async_cancel()
+        self._parcel_refresh_debouncer.async_cancel()
+        self.parcel_registry.async_remove(self)
+        self.scheduler.async_unregister(self.entry.entry_id)
+        async_remove_courier_policy(self.hass, self.courier, self.entry.entry_id)
+        await super().async_shutdown()
 
     async def _fetch_parcels_with_retry(self):
-        """Fetch parcels and retry once if unauthorized."""
+        """Fetch parcels through the courier policy and retry once if unauthorized."""
+        await self.token_manager.async_ensure_valid()
         try:
-            return await self._fetch_parcels()
-        except Exception as e:
-            if "401" in str(e) or "unauthorized" in str(e).lower():
-                _LOGGER.info("%s token expired, refreshing...", self.courier)
-                await self._refresh_token()
-                return await self._fetch_parcels()
-            raise e
+            return await self.policy.async_call(self._fetch_parcels)
+        except CourierAuthError:
+            _LOGGER.info("%s token expired, refreshing...", self.courier)
+            await self.token_manager.async_refresh()
+            return await self.policy.async_call(self._fetch_parcels)
 
     async def _fetch_single_parcel_with_retry(self, tracking_number: str):
-        """Fetch one parcel and retry once if unauthorized."""
+        """Fetch one parcel through the courier policy and retry once if unauthorized."""
+        await self.token_manager.async_ensure_valid()
         try:
-            return await self._fetch_single_parcel(tracking_number)
-        except Exception as e:
-            if "401" in str(e) or "unauthorized" in str(e).lower():
-                _LOGGER.info("%s token expired while fetching single parcel, refreshing...", self.courier)
-                await self._refresh_token()
-                return await self._fetch_single_parcel(tracking_number)
-            raise e
+            return await self.policy.async_call(lambda: self._fetch_single_parcel(tracking_number))
+        except CourierAuthError:
+            _LOGGER.info("%s token expired while fetching single parcel, refreshing...", self.courier)
+            await self.token_manager.async_refresh()
+            return await self.policy.async_call(lambda: self._fetch_single_parcel(tracking_number))
 
     async def _fetch_parcels(self):
         """Fetch parcels from API without retry logic."""
         if self.courier == "inpost":
-            data = await self.api.get_parcels()
+            data = await self._get_parcel_list(self._last_parcels)
+            if data is NOT_MODIFIED:
+                return self._last_parcels
             return data if isinstance(data, list) else data.get("parcels", [])
             
         elif self.courier == "dpd":
@@ -143,55 +411,76 @@ class ShipmentCoordinator(DataUpdateCoordinator):
             return await self._enrich_dpd_parcels(parcels)
             
         elif self.courier == "dhl":
-            data = await self.api.get_parcels()
-            return data.get("shipments", [])
+            shipments = []
+            async for data in self.api.iter_parcel_pages(await self.api.get_parcels()):
+                if isinstance(data, dict):
+                    shipments.extend(data.get("shipments") or [])
+            return shipments
 
         elif self.courier == "pocztex":
-            data = await self.api.get_parcels()
-            parcels = []
-            if isinstance(data, list):
-                parcels = data
-            elif isinstance(data, dict):
-                for key in ("packages", "items", "tracking", "data", "content"):
-                    if key in data and isinstance(data[key], list):
-                        parcels = data[key]
-                        break
-            if not parcels:
-                return []
-
-            # Pocztex needs separate calls for details
-            detail_tasks = []
-            for parcel in parcels:
-                detail_id = None
-                if isinstance(parcel, dict):
-                    detail_id = get_parcel_detail_id(parcel, self.courier)
-                if detail_id is None:
-                    detail_tasks.append(asyncio.sleep(0, result=None))
-                else:
-                    detail_tasks.append(self.api.get_parcel_details(detail_id))
-
-            details_results = await asyncio.gather(*detail_tasks, return_exceptions=True)
-            enriched = []
-            for parcel, details in zip(parcels, details_results):
-                if isinstance(details, Exception) or details is None:
-                    enriched.append(parcel)
-                    continue
-
-                if isinstance(parcel, dict):
-                    merged = dict(parcel)
-                    if isinstance(details, dict):
-                        merged.update(details)
-                    merged["_raw_response"] = details
-                    enriched.append(merged)
-                else:
-                    enriched.append(parcel)
+            self._partial_enrichment = False
+            data = await self._get_parcel_list(self._last_listed)
+            if data is NOT_MODIFIED:
+                # List unchanged; details still go through the detail cache.
+                enriched = await self._enrich_pocztex_parcels(self._last_listed)
+                self._discard_validators_if_partial()
+                return enriched
+            # Enrich each page while the following pages are still downloading.
+            listed = []
+            enrichments = []
+            try:
+                async for page in self.api.iter_parcel_pages(data):
+                    parcels = self._extract_pocztex_list(page)
+                    if parcels:
+                        listed.extend(parcels)
+                        enrichments.append(
+                            asyncio.ensure_future(self._enrich_pocztex_parcels(parcels, prune=False))
+                        )
+            except BaseException:
+                for task in enrichments:
+                    task.cancel()
+                raise
+            self._last_listed = listed
+            enriched = [parcel for page in await asyncio.gather(*enrichments) for parcel in page]
+            self._prune_detail_cache(listed)
+            self._discard_validators_if_partial()
             return enriched
         
         return []
 
+    @staticmethod
+    def _extract_pocztex_list(data):
+        """Return the parcels of one Pocztex list response."""
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            for key in ("packages", "items", "tracking", "data", "content"):
+                if key in data and isinstance(data[key], list):
+                    return data[key]
+        return []
+
+    async def _timed_detail_fetch(self, request):
+        """Await a detail request and record its latency."""
+        start = time.monotonic()
+        try:
+            return await request
+        finally:
+            self.metrics.record_detail_fetch(time.monotonic() - start)
+
+    async def _get_parcel_list(self, previous):
+        """Fetch the parcel list, or NOT_MODIFIED if the previous list is still current."""
+        data = await self.api.get_parcels()
+        if data is NOT_MODIFIED:
+            if previous is not None:
+                _LOGGER.debug("%s parcel list not modified, reusing previous data", self.courier)
+                return data
+            # Nothing to reuse (e.g. previous fetch failed after validators were stored).
+            self.api._validators.clear()
+            data = await self.api.get_parcels()
+        return data
+
     async def _enrich_dpd_parcels(self, parcels):
         """Fetch DPD parcel details to expose fields missing from the list endpoint."""
-        semaphore = asyncio.Semaphore(5)
 
         async def _fetch_details(parcel):
             if not isinstance(parcel, dict):
@@ -201,39 +490,122 @@ class ShipmentCoordinator(DataUpdateCoordinator):
             if not tracking_number:
                 return parcel
 
-            try:
-                async with semaphore:
-                    details = await self.api.get_parcel(tracking_number)
-            except Exception as err:
-                _LOGGER.debug(
-                    "Failed to fetch DPD parcel details for %s, keeping list payload: %s",
-                    tracking_number,
-                    err,
-                )
+            detail_parcel = self.detail_cache.get(tracking_number, parcel)
+            if detail_parcel is None:
+                try:
+                    details = await self.parcel_registry.async_fetch_detail(
+                        self.courier,
+                        tracking_number,
+                        lambda: self.detail_limiter.async_run(
+                            self._timed_detail_fetch(self.api.get_parcel(tracking_number))
+                        ),
+                    )
+                except Exception as err:
+                    _LOGGER.debug(
+                        "Failed to fetch DPD parcel details for %s, keeping list payload: %s",
+                        tracking_number,
+                        err,
+                    )
+                    return parcel
+
+                detail_parcel = self._extract_single_parcel(details, tracking_number)
+                if not isinstance(detail_parcel, dict):
+                    return parcel
+                self.detail_cache.put(tracking_number, parcel, detail_parcel)
+
+            merged = dict(parcel)
+            merged.update(detail_parcel)
+            merged["_raw_response"] = detail_parcel
+            return merged
+
+        return await self._gather_enriched(parcels, _fetch_details)
+
+    async def _enrich_pocztex_parcels(self, parcels, prune: bool = True):
+        """Fetch Pocztex parcel details, which the list endpoint does not include."""
+
+        async def _fetch_details(parcel):
+            if not isinstance(parcel, dict):
                 return parcel
 
-            detail_parcel = self._extract_single_parcel(details, tracking_number)
-            if not isinstance(detail_parcel, dict):
+            detail_id = get_parcel_detail_id(parcel, self.courier)
+            if detail_id is None:
                 return parcel
 
+            cache_id = get_parcel_id(parcel, self.courier) or detail_id
+            details = self.detail_cache.get(cache_id, parcel)
+            if details is None:
+                try:
+                    details = await self.parcel_registry.async_fetch_detail(
+                        self.courier,
+                        cache_id,
+                        lambda: self.detail_limiter.async_run(
+                            self._timed_detail_fetch(self.api.get_parcel_details(detail_id))
+                        ),
+                    )
+                except Exception as err:
+                    _LOGGER.debug(
+                        "Failed to fetch Pocztex parcel details for %s, keeping list payload: %s",
+                        detail_id,
+                        err,
+                    )
+                    self._partial_enrichment = True
+                    return parcel
+                if details is None:
+                    self._partial_enrichment = True
+                    return parcel
+                if isinstance(details, dict):
+                    self.detail_cache.put(cache_id, parcel, details)
+
             merged = dict(parcel)
-            merged.update(detail_parcel)
-            merged["_raw_response"] = detail_parcel
+            if isinstance(details, dict):
+                merged.update(details)
+            merged["_raw_response"] = details
             return merged
 
+        return await self._gather_enriched(parcels, _fetch_details, prune)
+
+    async def _gather_enriched(self, parcels, fetch_details, prune: bool = True):
+        """Run detail enrichment for all parcels and drop unused cache entries."""
         details_results = await asyncio.gather(
-            *(_fetch_details(parcel) for parcel in parcels),
+            *(fetch_details(parcel) for parcel in parcels),
             return_exceptions=True,
         )
 
         enriched = []
         for parcel, result in zip(parcels, details_results):
             if isinstance(result, Exception):
+                self._partial_enrichment = True
                 enriched.append(parcel)
             else:
                 enriched.append(result)
+
+        if prune:
+            self._prune_detail_cache(parcels)
         return enriched
 
+    def _discard_validators_if_partial(self) -> None:
+        """Refetch the list next poll if some parcels are missing their details."""
+        if self._partial_enrichment:
+            _LOGGER.debug("%s details incomplete, not reusing the parcel list", self.courier)
+            self.api._validators.clear()
+
+    def _prune_detail_cache(self, parcels) -> None:
+        """Drop cached details of parcels no account lists anymore."""
+        self.detail_cache.prune(
+            {
+                str(get_parcel_id(parcel, self.courier) or get_parcel_detail_id(parcel, self.courier))
+                for parcel in parcels
+                if isinstance(parcel, dict)
+            }
+            | self.parcel_registry.tracked_ids(self.courier, exclude=self)
+        )
+        _LOGGER.debug(
+            "%s detail cache: %d hits, %d misses so far",
+            self.courier,
+            self.detail_cache.hits,
+            self.detail_cache.misses,
+        )
+
     async def _fetch_single_parcel(self, tracking_number: str):
         """Fetch a single parcel details for couriers that support it."""
         if self.courier in {"inpost", "dpd", "dhl"}:
@@ -247,17 +619,10 @@ class ShipmentCoordinator(DataUpdateCoordinator):
             if not hasattr(self.api, "get_parcel_details"):
                 return None
             detail_id = tracking_number
-            current_data = self.data or []
-            existing_parcel = next(
-                (
-                    item
-                    for item in current_data
-                    if str(get_parcel_id(item, self.courier) or "") == str(tracking_number)
-                ),
-                None,
-            )
-            if isinstance(existing_parcel, dict):
-                detail_id = get_parcel_detail_id(existing_parcel, self.courier) or tracking_number
+            existing = self.get_parcel(tracking_number)
+            existing_parcel = existing.payload if existing is not None else None
+            if existing is not None:
+                detail_id = existing.detail_id or tracking_number
 
             data = await self.api.get_parcel_details(detail_id)
             self._log_single_parcel_response(detail_id, data)
@@ -306,49 +671,114 @@ class ShipmentCoordinator(DataUpdateCoordinator):
             payload,
         )
 
-    def _filter_active_parcels(self, parcels):
-        """Keep only active parcels in coordinator data."""
+    def _filter_active_parcels(self, parcels) -> list[ParcelRecord]:
+        """Build records for the active parcels kept in coordinator data."""
         if not isinstance(parcels, list):
             return []
-        return [
-            parcel
-            for parcel in parcels
-            if isinstance(parcel, dict) and not is_delivered(parcel, self.courier)
-        ]
+        records = []
+        for parcel in parcels:
+            if not isinstance(parcel, dict):
+                continue
+            record = ParcelRecord.from_payload(parcel, self.courier)
+            if record.id and not record.delivered:
+                records.append(record)
+        return records
 
     async def async_refresh_parcel(self, tracking_number: str) -> None:
-        """Refresh a single parcel when courier API supports it.
+        """Request a refresh of a single parcel."""
+        await self.async_refresh_parcels([tracking_number])
+
+    async def async_refresh_parcels(self, tracking_numbers) -> None:
+        """Queue parcels for a batched refresh after a short debounce window."""
+        self._pending_refresh.update(str(number) for number in tracking_numbers)
+        await self._parcel_refresh_debouncer.async_call()
+
+    async def _async_refresh_pending_parcels(self) -> None:
+        """Fetch all queued parcels and publish them in one coordinator update.
 
-        Falls back to full coordinator refresh if single fetch fails or returns unknown shape.
+        Falls back to full coordinator refresh if a single fetch fails or returns unknown shape.
         """
-        try:
-            parcel = await self._fetch_single_parcel_with_retry(tracking_number)
-        except Exception as err:
-            _LOGGER.debug(
-                "Single parcel refresh failed for %s %s, falling back to full refresh: %s",
-                self.courier,
-                tracking_number,
-                err,
-            )
-            await self.async_request_refresh()
+        tracking_numbers = sorted(self._pending_refresh)
+        self._pending_refresh.clear()
+        if not tracking_numbers:
             return
 
-        if not isinstance(parcel, dict):
-            await self.async_request_refresh()
-            return
+        semaphore = asyncio.Semaphore(SINGLE_REFRESH_CONCURRENCY)
 
-        current_data = list(self.data or [])
-        replaced = False
-        for idx, item in enumerate(current_data):
-            if str(get_parcel_id(item, self.courier) or "") == str(tracking_number):
-                current_data[idx] = parcel
-                replaced = True
-                break
+        async def _fetch(tracking_number):
+            async with semaphore:
+                return await self._fetch_single_parcel_with_retry(tracking_number)
 
-        if not replaced:
-            current_data.append(parcel)
+        results = await asyncio.gather(
+            *(_fetch(tracking_number) for tracking_number in tracking_numbers),
+            return_exceptions=True,
+        )
+
+        payloads = {}
+        needs_full_refresh = False
+        for tracking_number, parcel in zip(tracking_numbers, results):
+            if not isinstance(parcel, dict):
+                _LOGGER.debug(
+                    "Single parcel refresh failed for %s %s, falling back to full refresh: %s",
+                    self.courier,
+                    tracking_number,
+                    parcel,
+                )
+                needs_full_refresh = True
+                continue
 
-        self.async_set_updated_data(self._filter_active_parcels(current_data))
+            # The cached detail is now older than what is displayed; refetch on next poll.
+            self.detail_cache.invalidate(tracking_number)
+            payloads[tracking_number] = parcel
+
+        if payloads:
+            self.async_apply_parcels(payloads)
+            # Other accounts tracking the same parcels get the result for free.
+            self.parcel_registry.async_share(self, payloads)
+
+        if needs_full_refresh:
+            await self.async_request_refresh()
+
+    @callback
+    def async_apply_parcels(self, payloads: dict[str, dict]) -> None:
+        """Merge refreshed parcel payloads into the data as one update."""
+        records = dict(self.parcels_by_id)
+        finished = []
+        applied = {}
+        for tracking_number, parcel in payloads.items():
+            record = ParcelRecord.from_payload(parcel, self.courier)
+            existing = self.get_parcel(tracking_number)
+            if record.id != tracking_number and existing is not None:
+                # Keep the list-level id fields so the parcel stays indexed.
+                record = ParcelRecord.from_payload({**existing.payload, **parcel}, self.courier)
+            applied[tracking_number] = record.payload
+
+            if record.id and not record.delivered:
+                records[tracking_number] = record
+            elif records.pop(tracking_number, None) is not None and record.delivered:
+                finished.append(record)
+
+        self.archive.async_append(self.entry, self.courier, finished)
+        self._update_last_parcels(applied)
+        updated = self._index_parcels(list(records.values()))
+        if not self.data_from_cache:
+            self._persist(updated)
+        # Statuses may have changed; async_set_updated_data reschedules with this.
+        self._adapt_update_interval(updated)
+        self._schedule_next_poll()
+        self.async_set_updated_data(updated)
+
+    def _update_last_parcels(self, applied: dict[str, dict]) -> None:
+        """Merge refreshed payloads into the list reused on 304 responses."""
+        if not isinstance(self._last_parcels, list):
+            return
+        pending = dict(applied)
+        merged = []
+        for parcel in self._last_parcels:
+            parcel_id = get_parcel_id(parcel, self.courier) if isinstance(parcel, dict) else None
+            merged.append(pending.pop(str(parcel_id), parcel) if parcel_id else parcel)
+        merged.extend(pending.values())
+        self._last_parcels = merged
 
     async def _refresh_token(self):
         """Refresh API token and update config entry."""
@@ -0,0 +1,93 @@
+"""Cache of parcel detail payloads keyed by parcel id."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from .helpers import get_raw_status
+
+# Refetch details at least this often even when the list summary is unchanged.
+DETAIL_MAX_AGE = 6 * 60 * 60
+
+# List-level fields that change when a parcel gets a new tracking event.
+_TIMESTAMP_KEYS = (
+    "date",
+    "eventDate",
+    "lastEventDate",
+    "lastUpdate",
+    "modificationDate",
+    "stateDate",
+    "statusChangeDate",
+    "statusDate",
+    "updateDate",
+    "updatedAt",
+)
+
+# Fields read by the shipment sensors that only the detail endpoints provide.
+REQUIRED_DETAIL_FIELDS: dict[str, tuple[str, ...]] = {
+    "dpd": ("sender",),
+    "pocztex": ("senderName", "recipientName", "history"),
+}
+
+
+def detail_fingerprint(parcel: dict[str, Any], courier: str) -> tuple:
+    """Return a fingerprint of the list-level status and timestamp fields."""
+    sources = [parcel]
+    for key in ("main_status", "status"):
+        nested = parcel.get(key)
+        if isinstance(nested, dict):
+            sources.append(nested)
+    timestamps = tuple(
+        str(source.get(key)) for source in sources for key in _TIMESTAMP_KEYS if source.get(key) is not None
+    )
+    return (get_raw_status(parcel, courier), timestamps)
+
+
+class ParcelDetailCache:
+    """Remember the last detail payload per parcel and decide when to refetch."""
+
+    def __init__(self, courier: str, max_age: float = DETAIL_MAX_AGE) -> None:
+        """Initialize an empty cache."""
+        self.courier = courier
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[tuple, dict[str, Any], float]] = {}
+
+    def get(self, parcel_id: str, parcel: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the cached detail if it is still valid for this list summary."""
+        entry = self._entries.get(str(parcel_id))
+        if entry is not None:
+            fingerprint, detail, fetched_at = entry
+            if (
+                fingerprint == detail_fingerprint(parcel, self.courier)
+                and time.monotonic() - fetched_at < self.max_age
+                and self._has_required_fields(parcel, detail)
+            ):
+                self.hits += 1
+                return detail
+        self.misses += 1
+        return None
+
+    def put(self, parcel_id: str, parcel: dict[str, Any], detail: dict[str, Any]) -> None:
+        """Store a freshly fetched detail payload."""
+        self._entries[str(parcel_id)] = (
+            detail_fingerprint(parcel, self.courier),
+            detail,
+            time.monotonic(),
+        )
+
+    def invalidate(self, parcel_id: str) -> None:
+        """Force the next poll to refetch a parcel's details."""
+        self._entries.pop(str(parcel_id), None)
+
+    def prune(self, parcel_ids: set[str]) -> None:
+        """Drop entries for parcels no longer listed."""
+        for parcel_id in self._entries.keys() - parcel_ids:
+            del self._entries[parcel_id]
+
+    def _has_required_fields(self, parcel: dict[str, Any], detail: dict[str, Any]) -> bool:
+        return all(
+            field in parcel or field in detail
+            for field in REQUIRED_DETAIL_FIELDS.get(self.courier, ())
+        )
@@ -0,0 +1,64 @@
+"""Per-account index of this integration's entity registry entries."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+
+class EntityIndex:
+    """Unique IDs of one config entry's registry entries, by entity domain.
+
+    Seeded once from the registry's per-config-entry lookup and then kept in
+    step with the entities the platforms add and remove, so reconciling the
+    parcel list never scans the whole entity registry.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the index; it is seeded on first use."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self._unique_ids: dict[str, set[str]] | None = None
+
+    def _index(self) -> dict[str, set[str]]:
+        if self._unique_ids is None:
+            self._unique_ids = {}
+            registry = er.async_get(self.hass)
+            for entity_entry in er.async_entries_for_config_entry(registry, self.entry_id):
+                if entity_entry.platform == DOMAIN and entity_entry.unique_id:
+                    self._unique_ids.setdefault(entity_entry.domain, set()).add(
+                        entity_entry.unique_id
+                    )
+        return self._unique_ids
+
+    def unique_ids(self, domain: str) -> set[str]:
+        """Return the indexed unique IDs of an entity domain."""
+        return set(self._index().get(domain, ()))
+
+    @callback
+    def async_add(self, domain: str, unique_ids: Iterable[str]) -> None:
+        """Record entities the platform just added for this account."""
+        self._index().setdefault(domain, set()).update(unique_ids)
+
+    @callback
+    def async_remove_stale(self, domain: str, is_current: Callable[[str], bool]) -> None:
+        """Remove this account's registry entries that are no longer current."""
+        known = self._index().get(domain)
+        if not known:
+            return
+        stale = [unique_id for unique_id in known if not is_current(unique_id)]
+        if not stale:
+            return
+        registry = er.async_get(self.hass)
+        for unique_id in stale:
+            known.discard(unique_id)
+            entity_id = registry.async_get_entity_id(domain, DOMAIN, unique_id)
+            if entity_id is None:
+                # Already removed, e.g. deleted by the user.
+                continue
+            entity_entry = registry.async_get(entity_id)
+            if entity_entry and entity_entry.config_entry_id == self.entry_id:
+                registry.async_remove(entity_id)
@@ -102,6 +102,8 @@ const CARD_TRANSLATIONS = {
 };
 
 const DEFAULT_LANGUAGE = "en";
+// Wait this long before retrying a failed raw payload request for the same version.
+const RAW_PAYLOAD_RETRY_MS = 60000;
 
 const normalizeLanguage = (language) => {
   if (!language) return DEFAULT_LANGUAGE;
@@ -729,6 +731,55 @@ class ShipmentTrackingCard extends HTMLElement {
     this._getManageUrlRequests().set(key, request);
   }
 
+  _getRawPayloadCache() {
+    if (!this._rawPayloadCache) {
+      this._rawPayloadCache = new Map();
+    }
+    return this._rawPayloadCache;
+  }
+
+  _getRawPayload(entityId, attrs) {
+    // The raw courier payload is not a state attribute; fetch it on demand and
+    // keep it until the sensor reports a new payload version.
+    const cached = this._getRawPayloadCache().get(entityId);
+    if (
+      cached &&
+      cached.version === attrs.payload_version &&
+      (!cached.error || Date.now() - cached.failedAt < RAW_PAYLOAD_RETRY_MS)
+    ) {
+      return cached.raw;
+    }
+
+    if (!this._rawPayloadRequests) {
+      this._rawPayloadRequests = new Set();
+    }
+    if (!this._rawPayloadRequests.has(entityId)) {
+      this._rawPayloadRequests.add(entityId);
+      const version = attrs.payload_version;
+      this._hass.callWS({ type: "polish_shipment_tracking/raw_payload", entity_id: entityId })
+        .then((result) => {
+          this._getRawPayloadCache().set(entityId, { version, raw: result.payload });
+          if (this._openDialogEntityId === entityId) {
+            this.openDialog(entityId, { reopen: false });
+          }
+        })
+        .catch((err) => {
+          console.error("Failed to load raw payload", err);
+          // Remember the failure so state updates do not retry it right away.
+          const previous = this._getRawPayloadCache().get(entityId);
+          this._getRawPayloadCache().set(entityId, {
+            version,
+            raw: previous ? previous.raw : null,
+            error: true,
+            failedAt: Date.now(),
+          });
+        })
+        .finally(() => this._rawPayloadRequests.delete(entityId));
+    }
+    // Show the previous payload, if any, until the new one arrives.
+    return cached ? cached.raw : null;
+  }
+
   _openExternalUrl(url) {
     if (!url) return;
     const link = document.createElement("a");
@@ -827,7 +878,7 @@ class ShipmentTrackingCard extends HTMLElement {
     this._openDialogEntityId = entityId;
 
     const attrs = stateObj.attributes;
-    const rawStr = attrs.raw_response;
+    const raw = this._getRawPayload(entityId, attrs);
     const friendlyName = attrs.sender || attrs.sender_name || attrs.recipient_name || attrs.tracking_number;
     
     this.querySelector('#modal-title').innerText = friendlyName;
@@ -903,9 +954,8 @@ class ShipmentTrackingCard extends HTMLElement {
     let timelineHtml = '';
     let manageShipmentAvailable = false;
     
-    if (rawStr) {
+    if (raw) {
       try {
-        const raw = JSON.parse(rawStr);
         const courier = (attrs.courier || (entityId.includes('inpost') ? 'inpost' : '')).toLowerCase();
         manageShipmentAvailable = this._hasDpdManageAction(attrs, raw);
         const locale = this._hass.language || 'pl';
@@ -1048,7 +1098,7 @@ class ShipmentTrackingCard extends HTMLElement {
           });
         }
       } catch (e) {
-        console.error("Failed to parse raw_response", e);
+        console.error("Failed to render raw payload", e);
       }
     } else {
       if (this._isEnabled("show_dialog_pickup_point") && (attrs.location || attrs.current_location)) {
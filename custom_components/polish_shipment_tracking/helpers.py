@@ -1,4 +1,6 @@
 """Helper functions for Polish Shipment Tracking."""
+from functools import lru_cache
+
 from .const import DOMAIN
 
 def get_parcel_id(data: dict, courier: str) -> str | None:
@@ -267,19 +269,19 @@ _STATUS_MAP = {
     },
 }
 
-def normalize_status(raw_status, courier):
-    """Normalize status to one of the predefined keys."""
-    status_text = str(raw_status or "").strip()
-    if not status_text:
-        return "unknown"
+_ASCII_TABLE = str.maketrans("ąćęłńóśżź", "acelnoszz")
+
 
+@lru_cache(maxsize=2048)
+def _normalize_status_text(courier, status_text: str) -> str:
+    """Normalize a stripped, non-empty status text; memoised per courier."""
     status_upper = status_text.upper()
     courier_map = _STATUS_MAP.get(courier, {})
     if status_upper in courier_map:
         return courier_map[status_upper]
 
     status_lower = status_text.lower()
-    status_ascii = status_lower.translate(str.maketrans("ąćęłńóśżź", "acelnoszz"))
+    status_ascii = status_lower.translate(_ASCII_TABLE)
     
     # Generic fallbacks
     if status_lower in {"ready"}:
@@ -321,7 +323,10 @@ def normalize_status(raw_status, courier):
 
     return "unknown"
 
-def is_delivered(data: dict, courier: str) -> bool:
-    """Check if parcel is delivered."""
-    status_key = normalize_status(get_raw_status(data, courier), courier)
-    return status_key in {"delivered", "returned", "cancelled"}
+
+def normalize_status(raw_status, courier):
+    """Normalize status to one of the predefined keys."""
+    status_text = str(raw_status or "").strip()
+    if not status_text:
+        return "unknown"
+    return _normalize_status_text(courier, status_text)
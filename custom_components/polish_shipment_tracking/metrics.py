@@ -0,0 +1,131 @@
+"""Request metrics for courier API health reporting."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+# Number of recent samples kept for percentiles and success rate.
+LATENCY_SAMPLES = 256
+OUTCOME_SAMPLES = 100
+
+
+def _percentile(samples, percent: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class EndpointMetrics:
+    """Counters and a latency reservoir for one API endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.requests = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.bytes = 0
+        self.status_codes: dict[int, int] = {}
+        self.decodes = 0
+        self.decodes_offloaded = 0
+        self.decode_total_ms = 0.0
+        self.decode_max_ms = 0.0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, latency: float, status: int | None, size: int, timeout: bool) -> None:
+        """Record one request outcome; latency is in seconds."""
+        self.requests += 1
+        self.bytes += size
+        self._latencies.append(latency)
+        if status is not None:
+            self.status_codes[status] = self.status_codes.get(status, 0) + 1
+        if timeout:
+            self.timeouts += 1
+        if status is None or status >= 400:
+            self.failures += 1
+
+    def record_decode(self, elapsed_ms: float, offloaded: bool) -> None:
+        """Record the time spent decoding one response body."""
+        self.decodes += 1
+        self.decodes_offloaded += int(offloaded)
+        self.decode_total_ms += elapsed_ms
+        self.decode_max_ms = max(self.decode_max_ms, elapsed_ms)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly summary with p50/p95/p99 latency in ms."""
+        summary = {
+            "requests": self.requests,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "bytes": self.bytes,
+            "status_codes": dict(self.status_codes),
+            "decode_mean_ms": round(self.decode_total_ms / self.decodes, 2) if self.decodes else None,
+            "decode_max_ms": round(self.decode_max_ms, 2) if self.decodes else None,
+            "decodes_offloaded": self.decodes_offloaded,
+        }
+        for percent in (50, 95, 99):
+            value = _percentile(self._latencies, percent)
+            summary[f"p{percent}_ms"] = round(value * 1000, 1) if value is not None else None
+        return summary
+
+
+class ApiMetrics:
+    """Per-account API metrics shared by the client and the coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+        self.last_refresh_duration: float | None = None
+        self.last_refresh_success: bool | None = None
+        self._outcomes: deque[bool] = deque(maxlen=OUTCOME_SAMPLES)
+        self._detail_latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record_request(
+        self,
+        endpoint: str,
+        latency: float,
+        status: int | None,
+        size: int = 0,
+        timeout: bool = False,
+    ) -> None:
+        """Record one HTTP request made by the API client."""
+        self._endpoint(endpoint).record(latency, status, size, timeout)
+        self._outcomes.append(status is not None and status < 400)
+
+    def record_decode(self, endpoint: str, elapsed_ms: float, offloaded: bool) -> None:
+        """Record the JSON decode time of one response body."""
+        self._endpoint(endpoint).record_decode(elapsed_ms, offloaded)
+
+    def _endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def record_detail_fetch(self, latency: float) -> None:
+        """Record the duration of one parcel detail fetch."""
+        self._detail_latencies.append(latency)
+
+    def record_refresh(self, duration: float, success: bool) -> None:
+        """Record the duration of a full coordinator refresh."""
+        self.last_refresh_duration = duration
+        self.last_refresh_success = success
+
+    @property
+    def success_rate(self) -> float | None:
+        """Return the percentage of successful recent requests."""
+        if not self._outcomes:
+            return None
+        return round(100 * sum(self._outcomes) / len(self._outcomes), 1)
+
+    @property
+    def mean_detail_latency(self) -> float | None:
+        """Return the mean detail fetch latency in ms."""
+        if not self._detail_latencies:
+            return None
+        return round(1000 * sum(self._detail_latencies) / len(self._detail_latencies), 1)
+
+    def endpoint_summary(self) -> dict[str, dict[str, Any]]:
+        """Return per-endpoint summaries."""
+        return {name: metrics.as_dict() for name, metrics in self.endpoints.items()}
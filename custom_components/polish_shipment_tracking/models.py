@@ -0,0 +1,47 @@
+"""Parcel data model shared by the coordinator and its entities."""
+from __future__ import annotations
+
+from typing import Any
+
+from .helpers import get_parcel_detail_id, get_parcel_id, get_raw_status, normalize_status
+
+# Status keys of parcels that are no longer tracked as active.
+FINAL_STATUS_KEYS = frozenset({"delivered", "returned", "cancelled"})
+
+
+class ParcelRecord:
+    """A courier parcel payload with its derived fields computed once."""
+
+    __slots__ = ("id", "detail_id", "raw_status", "status_key", "delivered", "payload")
+
+    def __init__(
+        self,
+        id: str | None,
+        detail_id: str | None,
+        raw_status: str | None,
+        status_key: str,
+        payload: dict[str, Any],
+    ) -> None:
+        """Initialize the record."""
+        self.id = id
+        self.detail_id = detail_id
+        self.raw_status = raw_status
+        self.status_key = status_key
+        self.delivered = status_key in FINAL_STATUS_KEYS
+        self.payload = payload
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any], courier: str) -> ParcelRecord:
+        """Build a record from a raw (enriched) courier payload."""
+        parcel_id = get_parcel_id(payload, courier)
+        raw_status = get_raw_status(payload, courier)
+        return cls(
+            str(parcel_id) if parcel_id else None,
+            get_parcel_detail_id(payload, courier),
+            raw_status,
+            normalize_status(raw_status, courier),
+            payload,
+        )
+
+    def __repr__(self) -> str:
+        return f"ParcelRecord(id={self.id!r}, status_key={self.status_key!r})"
@@ -0,0 +1,111 @@
+"""Domain-wide registry of parcels tracked by more than one account."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api_helpers import SingleFlight
+from .const import DOMAIN
+from .detail_cache import ParcelDetailCache
+
+if TYPE_CHECKING:
+    from .coordinator import ShipmentCoordinator
+
+DATA_PARCEL_REGISTRY = "_parcel_registry"
+
+_T = TypeVar("_T")
+
+
+class ParcelRegistry:
+    """Map (courier, tracking number) to the accounts that track the parcel.
+
+    The first account to list a parcel owns it. Detail payloads are cached
+    per courier for all accounts, and concurrent detail fetches of the same
+    parcel share one request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._trackers: dict[tuple[str, str], list[ShipmentCoordinator]] = {}
+        self._by_coordinator: dict[ShipmentCoordinator, set[str]] = {}
+        self._detail_caches: dict[str, ParcelDetailCache] = {}
+        self._inflight = SingleFlight()
+
+    def detail_cache(self, courier: str) -> ParcelDetailCache:
+        """Return the detail cache shared by all accounts of a courier."""
+        cache = self._detail_caches.get(courier)
+        if cache is None:
+            cache = self._detail_caches[courier] = ParcelDetailCache(courier)
+        return cache
+
+    @callback
+    def async_set_parcels(self, coordinator: ShipmentCoordinator, parcel_ids: Iterable[str]) -> None:
+        """Record the parcels an account currently tracks."""
+        courier = coordinator.courier
+        new_ids = set(parcel_ids)
+        old_ids = self._by_coordinator.get(coordinator, set())
+        for parcel_id in old_ids - new_ids:
+            self._untrack(courier, parcel_id, coordinator)
+        for parcel_id in new_ids - old_ids:
+            self._trackers.setdefault((courier, parcel_id), []).append(coordinator)
+        self._by_coordinator[coordinator] = new_ids
+
+    @callback
+    def async_remove(self, coordinator: ShipmentCoordinator) -> None:
+        """Forget an account, handing its parcels to the next tracker."""
+        for parcel_id in self._by_coordinator.pop(coordinator, set()):
+            self._untrack(coordinator.courier, parcel_id, coordinator)
+
+    def _untrack(self, courier: str, parcel_id: str, coordinator: ShipmentCoordinator) -> None:
+        key = (courier, parcel_id)
+        trackers = self._trackers.get(key)
+        if trackers and coordinator in trackers:
+            trackers.remove(coordinator)
+            if not trackers:
+                del self._trackers[key]
+
+    def owner(self, courier: str, parcel_id: str) -> ShipmentCoordinator | None:
+        """Return the account that fetches the parcel on behalf of the others."""
+        trackers = self._trackers.get((courier, str(parcel_id)))
+        return trackers[0] if trackers else None
+
+    def peers(self, coordinator: ShipmentCoordinator, parcel_id: str) -> list[ShipmentCoordinator]:
+        """Return the other accounts tracking the same parcel."""
+        trackers = self._trackers.get((coordinator.courier, str(parcel_id)), [])
+        return [tracker for tracker in trackers if tracker is not coordinator]
+
+    def tracked_ids(self, courier: str, exclude: ShipmentCoordinator | None = None) -> set[str]:
+        """Return the parcel ids tracked by any (other) account of a courier."""
+        return {
+            parcel_id
+            for (parcel_courier, parcel_id), trackers in self._trackers.items()
+            if parcel_courier == courier and any(tracker is not exclude for tracker in trackers)
+        }
+
+    async def async_fetch_detail(
+        self, courier: str, parcel_id: str, fetch: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Fetch a parcel's details, joining an identical in-flight fetch."""
+        return await self._inflight.do((courier, str(parcel_id)), fetch)
+
+    @callback
+    def async_share(self, coordinator: ShipmentCoordinator, payloads: dict[str, dict[str, Any]]) -> None:
+        """Hand freshly refreshed parcel payloads to the other tracking accounts."""
+        shared: dict[ShipmentCoordinator, dict[str, dict[str, Any]]] = {}
+        for parcel_id, payload in payloads.items():
+            for peer in self.peers(coordinator, parcel_id):
+                shared.setdefault(peer, {})[parcel_id] = payload
+        for peer, peer_payloads in shared.items():
+            peer.async_apply_parcels(peer_payloads)
+
+
+@callback
+def async_get_parcel_registry(hass: HomeAssistant) -> ParcelRegistry:
+    """Return the domain-wide parcel registry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(DATA_PARCEL_REGISTRY)
+    if registry is None:
+        registry = domain_data[DATA_PARCEL_REGISTRY] = ParcelRegistry()
+    return registry
@@ -0,0 +1,256 @@
+"""Retry, backoff and circuit breaking for courier API calls."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+import logging
+import random
+import time
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api_helpers import CourierApiError, CourierRateLimitError, CourierTimeoutError
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_POLICIES = "_courier_policies"
+DATA_LIMITERS = "_concurrency_limiters"
+
+_T = TypeVar("_T")
+
+
+class CircuitOpenError(CourierApiError):
+    """Raised instead of calling a courier whose circuit is open."""
+
+    def __init__(self, courier: str, retry_in: float):
+        super().__init__(
+            f"{courier} API unavailable, polling paused for {int(retry_in)}s",
+            retry_after=retry_in,
+        )
+
+
+class CircuitBreaker:
+    """Stop calling a courier after repeated failures, probing again later."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 300.0,
+        max_recovery_timeout: float = 3600.0,
+    ) -> None:
+        """Initialize the breaker."""
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.max_recovery_timeout = max_recovery_timeout
+        self._failures = 0
+        self._opened_until = 0.0
+        self._open_count = 0
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if not self._opened_until:
+            return "closed"
+        if time.monotonic() < self._opened_until:
+            return "open"
+        return "half_open"
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until the next call is allowed."""
+        return max(0.0, self._opened_until - time.monotonic())
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now."""
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self._failures = 0
+        self._opened_until = 0.0
+        self._open_count = 0
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Count a failed call and open the circuit when the threshold is hit."""
+        self._failures += 1
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            # Each consecutive opening doubles the pause, up to the maximum.
+            timeout = min(
+                self.recovery_timeout * (2 ** self._open_count),
+                self.max_recovery_timeout,
+            )
+            self._open(max(timeout, retry_after or 0.0))
+            self._open_count += 1
+        elif retry_after:
+            self._open(retry_after)
+
+    def _open(self, seconds: float) -> None:
+        self._opened_until = time.monotonic() + seconds
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0) -> None:
+        """Initialize the policy."""
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retry number ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CourierPolicy:
+    """Apply retries and a circuit breaker to one account's courier calls."""
+
+    def __init__(
+        self,
+        courier: str,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """Initialize the policy engine."""
+        self.courier = courier
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+
+    async def async_call(self, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Call ``func``, retrying transient errors and honoring Retry-After."""
+        if not self.breaker.allow():
+            raise CircuitOpenError(self.courier, self.breaker.retry_in)
+
+        attempt = 0
+        while True:
+            try:
+                result = await func()
+            except CourierApiError as err:
+                if not err.retryable:
+                    # Expired tokens and rejected requests concern the account
+                    # and are handled by the caller; they do not trip the breaker.
+                    raise
+                attempt += 1
+                delay = err.retry_after if err.retry_after is not None else self.retry.backoff(attempt - 1)
+                if attempt >= self.retry.max_attempts or delay > self.retry.max_delay:
+                    self.breaker.record_failure(err.retry_after)
+                    raise
+                _LOGGER.debug(
+                    "%s API call failed (%s), retry %d/%d in %.1fs",
+                    self.courier,
+                    err,
+                    attempt,
+                    self.retry.max_attempts - 1,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Return breaker state for diagnostics."""
+        return {"state": self.breaker.state, "retry_in": round(self.breaker.retry_in, 1)}
+
+
+@callback
+def async_get_courier_policy(hass: HomeAssistant, courier: str, entry_id: str) -> CourierPolicy:
+    """Return the policy for one account of a courier.
+
+    Breakers are per account so one account's failures do not pause the
+    others; the per-host concurrency limiter is what stays shared.
+    """
+    policies = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_POLICIES, {})
+    policy = policies.get((courier, entry_id))
+    if policy is None:
+        policy = policies[(courier, entry_id)] = CourierPolicy(courier)
+    return policy
+
+
+@callback
+def async_remove_courier_policy(hass: HomeAssistant, courier: str, entry_id: str) -> None:
+    """Forget the policy of an unloaded account."""
+    hass.data.get(DOMAIN, {}).get(DATA_POLICIES, {}).pop((courier, entry_id), None)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for requests against one courier host.
+
+    The limit grows by about one per round of healthy responses and is
+    halved when the host times out or throttles.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: float = 4.0,
+        min_limit: float = 1.0,
+        max_limit: float = 32.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        """Initialize the limiter."""
+        self.name = name
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+        self._latencies: deque[float] = deque(maxlen=50)
+        self._last_decrease = 0.0
+
+    async def async_run(self, request: Awaitable[_T]) -> _T:
+        """Await ``request`` once a slot is free and adjust the limit."""
+        try:
+            async with self._condition:
+                await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+                self.in_flight += 1
+        except BaseException:
+            if asyncio.iscoroutine(request):
+                request.close()
+            raise
+
+        start = time.monotonic()
+        try:
+            result = await request
+        except (CourierTimeoutError, CourierRateLimitError, asyncio.TimeoutError):
+            self._decrease(start)
+            raise
+        else:
+            self._on_success(time.monotonic() - start)
+            return result
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def _on_success(self, latency: float) -> None:
+        # Latency well above the best recent response means the host queues us.
+        baseline = min(self._latencies, default=latency)
+        self._latencies.append(latency)
+        if latency <= baseline * self.latency_tolerance + 0.05:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _decrease(self, started: float) -> None:
+        # Requests sent before the last cut already saw the old limit; cut once.
+        if started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        _LOGGER.debug("%s concurrency limit reduced to %.1f", self.name, self.limit)
+
+
+@callback
+def async_get_concurrency_limiter(hass: HomeAssistant, host: str) -> AdaptiveLimiter:
+    """Return the shared concurrency limiter for a courier host."""
+    limiters = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_LIMITERS, {})
+    limiter = limiters.get(host)
+    if limiter is None:
+        limiter = limiters[host] = AdaptiveLimiter(host)
+    return limiter
@@ -0,0 +1,163 @@
+"""Poll scheduling for shipment coordinators."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from datetime import timedelta
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DOMAIN,
+)
+
+DATA_POLL_SCHEDULER = "_poll_scheduler"
+
+# Polls allowed to run at once across all accounts, and per courier.
+GLOBAL_POLL_CONCURRENCY = 4
+COURIER_POLL_CONCURRENCY = 2
+
+# Preferred poll interval in minutes for each normalized status key.
+STATUS_POLL_INTERVALS: dict[str, int] = {
+    "handed_out_for_delivery": 5,
+    "waiting_for_pickup": 5,
+    "exception": 15,
+    "in_transport": 15,
+    "unknown": 15,
+    "created": 60,
+}
+
+
+def get_poll_bounds(entry: ConfigEntry) -> tuple[int, int]:
+    """Return the configured (min, max) poll interval in minutes."""
+    min_interval = int(entry.options.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL))
+    max_interval = int(entry.options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL))
+    return min_interval, max(min_interval, max_interval)
+
+
+def compute_poll_interval(status_keys: Iterable[str], min_interval: int, max_interval: int) -> timedelta:
+    """Pick the next poll interval from the statuses of active parcels.
+
+    The most urgent parcel decides; accounts without active parcels back
+    off to the maximum interval.
+    """
+    minutes = min(
+        (STATUS_POLL_INTERVALS.get(key, STATUS_POLL_INTERVALS["unknown"]) for key in status_keys),
+        default=max_interval,
+    )
+    return timedelta(minutes=min(max(minutes, min_interval), max_interval))
+
+
+class PollScheduler:
+    """Spread account polls over their interval and cap concurrent polls."""
+
+    def __init__(
+        self,
+        global_limit: int = GLOBAL_POLL_CONCURRENCY,
+        courier_limit: int = COURIER_POLL_CONCURRENCY,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.courier_limit = courier_limit
+        self._global = asyncio.Semaphore(global_limit)
+        self._couriers: dict[str, asyncio.Semaphore] = {}
+        self._entries: list[str] = []
+        self._queued: dict[str, int] = {}
+        self._running: dict[str, int] = {}
+
+    @callback
+    def async_register(self, entry_id: str) -> None:
+        """Add an account to the poll rotation."""
+        if entry_id not in self._entries:
+            self._entries.append(entry_id)
+            self._entries.sort()
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        """Remove an account from the poll rotation."""
+        if entry_id in self._entries:
+            self._entries.remove(entry_id)
+
+    def phase(self, entry_id: str) -> float:
+        """Return the account's slot within an interval as a fraction in [0, 1)."""
+        if entry_id not in self._entries:
+            return 0.0
+        return self._entries.index(entry_id) / len(self._entries)
+
+    def next_poll_delay(self, entry_id: str, interval: timedelta) -> timedelta:
+        """Return a delay close to ``interval`` that lands on the account's slot.
+
+        Slots are aligned to wall-clock multiples of the interval, so accounts
+        sharing an interval poll evenly spaced instead of in lockstep.
+        """
+        period = interval.total_seconds()
+        if period <= 0:
+            return interval
+        now = time.time()
+        offset = self.phase(entry_id) * period
+        delay = (offset - now) % period
+        # Never poll much sooner or later than the requested interval.
+        if delay < period / 2:
+            delay += period
+        return timedelta(seconds=delay)
+
+    @asynccontextmanager
+    async def async_slot(self, courier: str) -> AsyncIterator[None]:
+        """Wait for a free global and per-courier poll slot."""
+        courier_semaphore = self._couriers.get(courier)
+        if courier_semaphore is None:
+            courier_semaphore = self._couriers[courier] = asyncio.Semaphore(self.courier_limit)
+
+        self._queued[courier] = self._queued.get(courier, 0) + 1
+        acquired = False
+        try:
+            # Take the courier slot first so waiting polls never hold a global slot.
+            async with courier_semaphore, self._global:
+                acquired = True
+                self._queued[courier] -= 1
+                self._running[courier] = self._running.get(courier, 0) + 1
+                try:
+                    yield
+                finally:
+                    self._running[courier] -= 1
+        finally:
+            if not acquired:
+                self._queued[courier] -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of polls waiting for a slot."""
+        return sum(self._queued.values())
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return scheduler state for diagnostics."""
+        return {
+            "accounts": len(self._entries),
+            "queue_depth": self.queue_depth,
+            "running": sum(self._running.values()),
+            "couriers": {
+                courier: {
+                    "queued": self._queued.get(courier, 0),
+                    "running": self._running.get(courier, 0),
+                }
+                for courier in self._couriers
+            },
+        }
+
+
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the domain-wide poll scheduler."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(DATA_POLL_SCHEDULER)
+    if scheduler is None:
+        scheduler = domain_data[DATA_POLL_SCHEDULER] = PollScheduler()
+    return scheduler
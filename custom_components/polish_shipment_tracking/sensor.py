@@ -1,31 +1,172 @@
 """Sensor platform for Polish Shipment Tracking."""
 from __future__ import annotations
 
-import json
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfTime,
+)
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, INTEGRATION_VERSION, CONF_PHONE, CONF_EMAIL
-from .coordinator import ShipmentCoordinator
-from .helpers import (
-    get_parcel_id,
-    get_raw_status,
-    is_delivered,
-    normalize_status,
+from .const import (
+    DOMAIN,
+    INTEGRATION_VERSION,
+    CONF_PHONE,
+    CONF_EMAIL,
+    CONF_BATCH_EVENTS,
+    DEFAULT_BATCH_EVENTS,
+    MAX_PENDING_EVENTS,
 )
+from .coordinator import ShipmentCoordinator
+from .models import ParcelRecord
 
 _LOGGER = logging.getLogger(__name__)
 
 ACTIVE_SHIPMENTS_UNIQUE_ID = f"{DOMAIN}_active_shipments"
 
+EVENT_NEW_SHIPMENT = f"{DOMAIN}_new_shipment"
+EVENT_SHIPMENT_STATUS_CHANGED = f"{DOMAIN}_shipment_status_changed"
+# Batched mode: one event per refresh with all new parcels and status changes.
+EVENT_SHIPMENTS_UPDATED = f"{DOMAIN}_shipments_updated"
+
+
+@dataclass(frozen=True, kw_only=True)
+class ApiHealthSensorEntityDescription(SensorEntityDescription):
+    """Describes a courier API health sensor."""
+
+    value_fn: Callable[[ShipmentCoordinator], float | int | None]
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    return round(value, digits) if value is not None else None
+
+
+API_HEALTH_SENSORS: tuple[ApiHealthSensorEntityDescription, ...] = (
+    ApiHealthSensorEntityDescription(
+        key="api_success_rate",
+        translation_key="api_success_rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.metrics.success_rate,
+    ),
+    ApiHealthSensorEntityDescription(
+        key="last_refresh_duration",
+        translation_key="last_refresh_duration",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _round(coordinator.metrics.last_refresh_duration, 2),
+    ),
+    ApiHealthSensorEntityDescription(
+        key="detail_fetch_latency",
+        translation_key="detail_fetch_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.metrics.mean_detail_latency,
+    ),
+    ApiHealthSensorEntityDescription(
+        key="token_refresh_count",
+        translation_key="token_refresh_count",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.token_manager.refresh_count,
+    ),
+)
+
+
+def _get_api_health_unique_id(entry: ConfigEntry, key: str) -> str:
+    return f"{entry.entry_id}_{key}"
+
+def _batch_events_enabled(entry: ConfigEntry) -> bool:
+    return entry.options.get(CONF_BATCH_EVENTS, DEFAULT_BATCH_EVENTS)
+
+
+def _build_status_changed_event_data(
+    courier: str,
+    entity_id: str | None,
+    old_record: ParcelRecord,
+    new_record: ParcelRecord,
+) -> dict[str, Any]:
+    return {
+        "courier": courier,
+        "shipment_id": new_record.id,
+        "entity_id": entity_id,
+        "old_status_raw": old_record.raw_status,
+        "old_status_key": old_record.status_key,
+        "new_status_raw": new_record.raw_status,
+        "new_status_key": new_record.status_key,
+    }
+
+
+def _merge_status_change(queued: dict[str, Any], event_data: dict[str, Any]) -> dict[str, Any] | None:
+    """Collapse two queued transitions of a parcel; None if it ended where it started."""
+    merged = {
+        **event_data,
+        "old_status_raw": queued["old_status_raw"],
+        "old_status_key": queued["old_status_key"],
+    }
+    return merged if merged["old_status_key"] != merged["new_status_key"] else None
+
+
+def _merge_by_shipment(
+    queued: list[dict[str, Any]],
+    items: list[dict[str, Any]],
+    merge: Callable[[dict[str, Any], dict[str, Any]], dict[str, Any] | None],
+) -> list[dict[str, Any]]:
+    by_shipment = {item["shipment_id"]: item for item in queued}
+    for item in items:
+        previous = by_shipment.get(item["shipment_id"])
+        merged = merge(previous, item) if previous is not None else item
+        if merged is None:
+            del by_shipment[item["shipment_id"]]
+        else:
+            by_shipment[item["shipment_id"]] = merged
+    return list(by_shipment.values())
+
+
+def _pending_event_key(event_type: str, event_data: dict[str, Any]) -> tuple:
+    if event_type == EVENT_SHIPMENTS_UPDATED:
+        return (event_type, event_data["entry_id"])
+    return (event_type, event_data.get("courier"), event_data.get("shipment_id"))
+
+
+def _merge_pending_event(
+    event_type: str, queued: dict[str, Any], event_data: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Combine a queued event with a newer one for the same key; None drops it."""
+    if event_type == EVENT_SHIPMENT_STATUS_CHANGED:
+        return _merge_status_change(queued, event_data)
+    if event_type == EVENT_SHIPMENTS_UPDATED:
+        merged = {
+            **event_data,
+            "new_shipments": _merge_by_shipment(
+                queued["new_shipments"], event_data["new_shipments"], lambda _, item: item
+            ),
+            "status_changes": _merge_by_shipment(
+                queued["status_changes"], event_data["status_changes"], _merge_status_change
+            ),
+        }
+        return merged if merged["new_shipments"] or merged["status_changes"] else None
+    return event_data
+
+
 @callback
 def _ensure_pending_events_listener(hass: HomeAssistant) -> None:
     domain_data = hass.data.setdefault(DOMAIN, {})
@@ -36,9 +177,9 @@ def _ensure_pending_events_listener(hass: HomeAssistant) -> None:
 
     @callback
     def _flush_pending_events(_: Any) -> None:
-        pending = domain_data.pop("_pending_events", [])
+        pending = domain_data.pop("_pending_events", {})
         domain_data.pop("_pending_events_listener", None)
-        for event_type, event_data in pending:
+        for event_type, event_data in pending.values():
             hass.bus.async_fire(event_type, event_data)
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _flush_pending_events)
@@ -49,8 +190,22 @@ def _queue_or_fire_event(hass: HomeAssistant, event_type: str, event_data: dict[
         hass.bus.async_fire(event_type, event_data)
         return
 
+    # Before startup, keep one (merged) event per parcel and a bounded queue.
     domain_data = hass.data.setdefault(DOMAIN, {})
-    domain_data.setdefault("_pending_events", []).append((event_type, event_data))
+    pending: dict[tuple, tuple[str, dict[str, Any]]] = domain_data.setdefault("_pending_events", {})
+    key = _pending_event_key(event_type, event_data)
+    if key in pending:
+        merged = _merge_pending_event(event_type, pending[key][1], event_data)
+        if merged is None:
+            del pending[key]
+        else:
+            pending[key] = (event_type, merged)
+    else:
+        if len(pending) >= MAX_PENDING_EVENTS:
+            dropped = next(iter(pending))
+            del pending[dropped]
+            _LOGGER.debug("Startup event queue full, dropping %s", dropped)
+        pending[key] = (event_type, event_data)
     _ensure_pending_events_listener(hass)
 
 async def async_setup_entry(
@@ -71,34 +226,78 @@ async def async_setup_entry(
     global_sensor.attach_coordinator(coordinator)
     entry.async_on_unload(lambda: global_sensor.detach_coordinator(coordinator))
 
+    async_add_entities(
+        ApiHealthSensor(coordinator, description) for description in API_HEALTH_SENSORS
+    )
+
     @callback
     def _build_new_shipment_event_data(sensor: "ShipmentSensor") -> dict[str, Any]:
-        raw_status = get_raw_status(sensor.parcel_data, coordinator.courier)
         return {
             "courier": coordinator.courier,
             "shipment_id": sensor._tracking_number,
             "entity_id": getattr(sensor, "entity_id", None),
-            "status_raw": raw_status,
-            "status_key": normalize_status(raw_status, coordinator.courier),
+            "status_raw": sensor.record.raw_status,
+            "status_key": sensor.record.status_key,
         }
 
+    @callback
+    def _async_fire_shipments_updated(
+        new_sensors: list[ShipmentSensor],
+        status_changes: tuple[tuple[ParcelRecord, ParcelRecord], ...],
+    ) -> None:
+        """Fire the bulk event of batched mode for one coordinator update."""
+        if not _batch_events_enabled(entry):
+            return
+        # Parcels whose sensor belongs to another account are reported there.
+        status_changes = tuple(
+            (old, new) for old, new in status_changes if new.id in coordinator.known_parcels
+        )
+        if not (new_sensors or status_changes):
+            return
+        registry = async_get_entity_registry(hass)
+        _queue_or_fire_event(
+            hass,
+            EVENT_SHIPMENTS_UPDATED,
+            {
+                "courier": coordinator.courier,
+                "entry_id": entry.entry_id,
+                "new_shipments": [
+                    _build_new_shipment_event_data(new_sensor) for new_sensor in new_sensors
+                ],
+                "status_changes": [
+                    _build_status_changed_event_data(
+                        coordinator.courier,
+                        registry.async_get_entity_id(
+                            "sensor", DOMAIN, f"{coordinator.courier}_{new.id}"
+                        ),
+                        old,
+                        new,
+                    )
+                    for old, new in status_changes
+                ],
+            },
+        )
+
     has_initialized = False
 
     @callback
     def async_update_parcels() -> None:
         """Add new sensors and remove old ones."""
         nonlocal has_initialized
-        current_data = coordinator.data or []
+        delta = coordinator.last_delta
+        # Parcels skipped because another account owns their sensor stay
+        # unknown, so they are re-checked until that account drops them.
+        unknown_ids = coordinator.parcels_by_id.keys() - coordinator.known_parcels
+        if has_initialized and not (unknown_ids or delta.removed):
+            # Only parcel contents changed; the sensors update themselves.
+            _async_fire_shipments_updated([], delta.status_changes)
+            return
+
         new_entities = []
         registry = async_get_entity_registry(hass)
         
-        current_ids = set()
-        for parcel in current_data:
-            pid = get_parcel_id(parcel, coordinator.courier)
-            if not pid or is_delivered(parcel, coordinator.courier):
-                continue
-            
-            current_ids.add(pid)
+        current_ids = set(coordinator.parcels_by_id)
+        for pid, record in coordinator.parcels_by_id.items():
             if pid not in coordinator.known_parcels:
                 unique_id = f"{coordinator.courier}_{pid}"
                 existing_entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
@@ -107,7 +306,7 @@ async def async_setup_entry(
                     if existing_entry and existing_entry.config_entry_id == entry.entry_id:
                         # Entity belongs to this config entry - still create runtime entity.
                         coordinator.known_parcels.add(pid)
-                        new_entities.append(ShipmentSensor(coordinator, parcel, pid))
+                        new_entities.append(ShipmentSensor(coordinator, record, pid))
                         continue
                     _LOGGER.debug(
                         "Skipping duplicate shipment entity for %s (already exists as %s)",
@@ -116,22 +315,29 @@ async def async_setup_entry(
                     )
                     continue
                 coordinator.known_parcels.add(pid)
-                new_entities.append(ShipmentSensor(coordinator, parcel, pid))
+                new_entities.append(ShipmentSensor(coordinator, record, pid))
         
         if new_entities:
             async_add_entities(new_entities)
+            coordinator.entity_index.async_add(
+                "sensor", [new_sensor.unique_id for new_sensor in new_entities]
+            )
             # Fire events for newly detected shipments.
             # If HA isn't running yet, queue and flush after startup.
-            if has_initialized:
+            if has_initialized and not _batch_events_enabled(entry):
                 for new_sensor in new_entities:
                     _queue_or_fire_event(
                         hass,
-                        f"{DOMAIN}_new_shipment",
+                        EVENT_NEW_SHIPMENT,
                         _build_new_shipment_event_data(new_sensor),
                     )
+        _async_fire_shipments_updated(
+            new_entities if has_initialized else [], delta.status_changes
+        )
 
         # Remove entities that are no longer present
-        _async_remove_old_entities(hass, entry, coordinator, current_ids)
+        if delta.removed or not has_initialized:
+            _async_remove_old_entities(hass, entry, coordinator, current_ids)
         
         # Keep track of active parcels for this coordinator
         coordinator.known_parcels.intersection_update(current_ids)
@@ -147,32 +353,25 @@ def _async_remove_old_entities(
     current_ids: set[str],
 ) -> None:
     """Remove entities that are no longer in the active parcels list."""
-    registry = async_get_entity_registry(hass)
     current_unique_ids = {f"{coordinator.courier}_{pid}" for pid in current_ids}
-    
-    entities_to_remove = []
-    for entity_entry in registry.entities.values():
-        if (
-            entity_entry.platform == DOMAIN
-            and entity_entry.config_entry_id == entry.entry_id
-            and entity_entry.unique_id != ACTIVE_SHIPMENTS_UNIQUE_ID
-            and entity_entry.unique_id not in current_unique_ids
-        ):
-            entities_to_remove.append(entity_entry.entity_id)
-            
-    for entity_id in entities_to_remove:
-        registry.async_remove(entity_id)
+    current_unique_ids |= {
+        _get_api_health_unique_id(entry, description.key) for description in API_HEALTH_SENSORS
+    }
+    current_unique_ids.add(ACTIVE_SHIPMENTS_UNIQUE_ID)
+    coordinator.entity_index.async_remove_stale("sensor", current_unique_ids.__contains__)
 
 class ShipmentSensor(CoordinatorEntity[ShipmentCoordinator], SensorEntity):
     """Sensor for a single shipment."""
 
     _attr_has_entity_name = True
     _attr_icon = "mdi:package-variant-closed"
+    # Large or per-update values that would bloat the recorder database.
+    _unrecorded_attributes = frozenset({"history", "payload_version"})
 
     def __init__(
         self,
         coordinator: ShipmentCoordinator,
-        parcel_data: dict,
+        record: ParcelRecord,
         tracking_number: str,
     ) -> None:
         """Initialize the sensor."""
@@ -186,7 +385,11 @@ class ShipmentSensor(CoordinatorEntity[ShipmentCoordinator], SensorEntity):
         self._attr_name = f"{self._courier.title()} {parcel_word} {tracking_number}"
         self._attr_unique_id = f"{self._courier}_{tracking_number}"
         self._attr_translation_key = "shipment_status"
-        self.parcel_data = parcel_data
+        self.record = record
+        # Fingerprint of the last written state, and the attributes built for it.
+        self._written_fingerprint: tuple | None = None
+        self._attrs_fingerprint: tuple | None = None
+        self._attrs: dict[str, Any] = {}
 
         account_id = coordinator.entry.data.get(CONF_PHONE) or coordinator.entry.data.get(CONF_EMAIL)
         self._attr_device_info = DeviceInfo(
@@ -197,15 +400,41 @@ class ShipmentSensor(CoordinatorEntity[ShipmentCoordinator], SensorEntity):
             sw_version=INTEGRATION_VERSION,
         )
 
+    @property
+    def parcel_data(self) -> dict:
+        """Return the raw parcel payload."""
+        return self.record.payload
+
+    @property
+    def available(self) -> bool:
+        """Stay available with cached data until the first poll confirms it."""
+        return self.coordinator.last_update_success or self.coordinator.data_from_cache
+
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        raw_status = get_raw_status(self.parcel_data, self._courier)
-        return normalize_status(raw_status, self._courier)
+        return self.record.status_key
+
+    def _state_fingerprint(self) -> tuple:
+        """Return a cheap key for everything the written state depends on."""
+        stale = self.coordinator.is_stale
+        return (
+            self.coordinator.payload_versions.get(self.record.id, 0),
+            self.available,
+            stale,
+            self.coordinator.last_success_at if stale else None,
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+        """Return the state attributes, rebuilt only when the parcel changed."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint != self._attrs_fingerprint:
+            self._attrs = self._build_attributes()
+            self._attrs_fingerprint = fingerprint
+        return self._attrs
+
+    def _build_attributes(self) -> dict[str, Any]:
         attrs = {
             "courier": self._courier,
             "tracking_number": self._tracking_number,
@@ -213,16 +442,17 @@ class ShipmentSensor(CoordinatorEntity[ShipmentCoordinator], SensorEntity):
             "account_contact": self._get_account_contact(),
         }
         
-        raw_status = get_raw_status(self.parcel_data, self._courier)
-        attrs["status_raw"] = raw_status
-        attrs["status_key"] = normalize_status(raw_status, self._courier)
-        
-        # Include raw response for the custom card
-        if "_raw_response" in self.parcel_data:
-            attrs["raw_response"] = json.dumps(self.parcel_data["_raw_response"], ensure_ascii=False)
-        else:
-            attrs["raw_response"] = json.dumps(self.parcel_data, ensure_ascii=False)
-            
+        attrs["status_raw"] = self.record.raw_status
+        attrs["status_key"] = self.record.status_key
+
+        # Only mark stale data, so regular polls don't churn the attributes.
+        attrs["stale"] = self.coordinator.is_stale
+        if attrs["stale"] and self.coordinator.last_success_at is not None:
+            attrs["last_successful_update"] = self.coordinator.last_success_at.isoformat()
+
+        # The card fetches the raw payload over the websocket API when needed.
+        attrs["payload_version"] = self.coordinator.payload_versions.get(self.record.id, 0)
+
         # Add courier specific attributes
         if self._courier == "inpost":
             self._add_inpost_attributes(attrs)
@@ -283,44 +513,93 @@ class ShipmentSensor(CoordinatorEntity[ShipmentCoordinator], SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        # Find our parcel in the new data
-        current_data = self.coordinator.data or []
-        my_parcel = next(
-            (p for p in current_data if get_parcel_id(p, self._courier) == self._tracking_number),
-            None
-        )
+        record = self.coordinator.get_parcel(self._tracking_number)
         
-        if my_parcel:
-            old_raw_status = get_raw_status(self.parcel_data, self._courier)
-            old_status_key = normalize_status(old_raw_status, self._courier)
-
-            new_raw_status = get_raw_status(my_parcel, self._courier)
-            new_status_key = normalize_status(new_raw_status, self._courier)
-
-            if old_status_key != new_status_key:
-                event_data = {
-                    "courier": self._courier,
-                    "shipment_id": self._tracking_number,
-                    "entity_id": getattr(self, "entity_id", None),
-                    "old_status_raw": old_raw_status,
-                    "old_status_key": old_status_key,
-                    "new_status_raw": new_raw_status,
-                    "new_status_key": new_status_key,
-                }
+        if record is self.record:
+            # Unchanged parcel; still write if availability or staleness changed.
+            self._async_write_state_if_changed()
+        elif record:
+            old_record = self.record
+            # In batched mode the platform reports transitions in one event.
+            if old_record.status_key != record.status_key and not _batch_events_enabled(
+                self.coordinator.entry
+            ):
                 _queue_or_fire_event(
                     self.coordinator.hass,
-                    f"{DOMAIN}_shipment_status_changed",
-                    event_data,
+                    EVENT_SHIPMENT_STATUS_CHANGED,
+                    _build_status_changed_event_data(
+                        self._courier, getattr(self, "entity_id", None), old_record, record
+                    ),
                 )
-            self.parcel_data = my_parcel
-            self.async_write_ha_state()
+            self.record = record
+            self._async_write_state_if_changed()
         else:
             # If not found, it might be delivered or removed. 
             # The async_update_parcels listener will handle removal.
             pass
 
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write state unless nothing it depends on changed since the last write."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._written_fingerprint:
+            return
+        self._written_fingerprint = fingerprint
+        self.async_write_ha_state()
+
+class ApiHealthSensor(CoordinatorEntity[ShipmentCoordinator], SensorEntity):
+    """Diagnostic sensor reporting courier API health for one account."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _unrecorded_attributes = frozenset({"endpoints"})
+    entity_description: ApiHealthSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ShipmentCoordinator,
+        description: ApiHealthSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = _get_api_health_unique_id(coordinator.entry, description.key)
+        account_id = coordinator.entry.data.get(CONF_PHONE) or coordinator.entry.data.get(CONF_EMAIL)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.entry.entry_id)},
+            name=f"{coordinator.courier.title()} ({account_id})",
+            manufacturer="Polish Shipment Tracking",
+            model=coordinator.courier.title(),
+            sw_version=INTEGRATION_VERSION,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the courier API fails, so degradation is visible."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the metric value."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return per-endpoint statistics on the success rate sensor."""
+        if self.entity_description.key != "api_success_rate":
+            return None
+        return {
+            "circuit": self.coordinator.policy.state,
+            "detail_concurrency": round(self.coordinator.detail_limiter.limit, 1),
+            "endpoints": self.coordinator.metrics.endpoint_summary(),
+        }
+
 class ActiveShipmentsSensor(SensorEntity):
-    """Sensor that counts active shipments across all accounts."""
+    """Sensor that counts active shipments across all accounts.
+
+    Counts are kept per courier, status key and account and are updated from
+    each coordinator's parcel delta, so an update costs only what changed.
+    """
 
     _attr_should_poll = False
     _attr_has_entity_name = True
@@ -333,28 +612,102 @@ class ActiveShipmentsSensor(SensorEntity):
         """Initialize the sensor."""
         self.hass = hass
         self._coordinators: dict[ShipmentCoordinator, Any] = {}
+        # Status key of every counted parcel, per coordinator.
+        self._statuses: dict[ShipmentCoordinator, dict[str, str]] = {}
+        self._total = 0
+        self._by_courier: Counter[str] = Counter()
+        self._by_status: Counter[str] = Counter()
+        # Keyed by config entry id; titles are neither unique nor stable.
+        self._by_account: Counter[str] = Counter()
+        self._attrs: dict[str, Any] | None = None
 
     def attach_coordinator(self, coordinator: ShipmentCoordinator) -> None:
         """Attach a coordinator to this sensor."""
         if coordinator not in self._coordinators:
+            self._statuses[coordinator] = {}
+            self._sync(coordinator, list(coordinator.parcels_by_id))
             self._coordinators[coordinator] = coordinator.async_add_listener(
-                self.async_write_ha_state
+                lambda: self._async_coordinator_updated(coordinator)
             )
+            if self.entity_id:
+                # Already added by another account; publish the new counts.
+                self.async_write_ha_state()
 
     def detach_coordinator(self, coordinator: ShipmentCoordinator) -> None:
         """Detach a coordinator from this sensor."""
         if coordinator in self._coordinators:
             unregister = self._coordinators.pop(coordinator)
             unregister()
+            for status_key in self._statuses.pop(coordinator).values():
+                self._count(coordinator, status_key, -1)
             self.async_write_ha_state()
 
+    @callback
+    def _async_coordinator_updated(self, coordinator: ShipmentCoordinator) -> None:
+        delta = coordinator.last_delta
+        if delta.added or delta.removed or delta.changed:
+            parcel_ids = delta.added | delta.removed | delta.changed
+        elif len(self._statuses[coordinator]) != len(coordinator.parcels_by_id):
+            # Parcels replaced without a delta (e.g. restored from cache); recount.
+            parcel_ids = self._statuses[coordinator].keys() | coordinator.parcels_by_id.keys()
+        else:
+            return
+        if self._sync(coordinator, parcel_ids):
+            self.async_write_ha_state()
+
+    def _sync(self, coordinator: ShipmentCoordinator, parcel_ids: Iterable[str]) -> bool:
+        """Recount the given parcels of a coordinator; return True if counts changed."""
+        statuses = self._statuses[coordinator]
+        parcels = coordinator.parcels_by_id
+        changed = False
+        for parcel_id in parcel_ids:
+            record = parcels.get(parcel_id)
+            new_status = None if record is None or record.delivered else record.status_key
+            old_status = statuses.get(parcel_id)
+            if new_status == old_status:
+                continue
+            changed = True
+            if old_status is not None:
+                self._count(coordinator, old_status, -1)
+                del statuses[parcel_id]
+            if new_status is not None:
+                self._count(coordinator, new_status, 1)
+                statuses[parcel_id] = new_status
+        return changed
+
+    def _count(self, coordinator: ShipmentCoordinator, status_key: str, amount: int) -> None:
+        self._total += amount
+        self._by_courier[coordinator.courier] += amount
+        self._by_status[status_key] += amount
+        self._by_account[coordinator.entry.entry_id] += amount
+        self._attrs = None
+
     @property
     def native_value(self) -> int:
         """Return the total count of active shipments."""
-        total = 0
-        for coordinator in self._coordinators:
-            data = coordinator.data or []
-            for parcel in data:
-                if not is_delivered(parcel, coordinator.courier):
-                    total += 1
-        return total
+        return self._total
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return active shipment counts by courier, status and account."""
+        if self._attrs is None:
+            self._attrs = {
+                "by_courier": {key: count for key, count in sorted(self._by_courier.items()) if count},
+                "by_status": {key: count for key, count in sorted(self._by_status.items()) if count},
+                "by_account": self._account_counts(),
+            }
+        return self._attrs
+
+    def _account_counts(self) -> dict[str, int]:
+        """Return the non-zero account counts keyed by account title."""
+        counts = {}
+        for entry_id, count in self._by_account.items():
+            if not count:
+                continue
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            title = entry.title if entry is not None and entry.title else entry_id
+            if title in counts:
+                # Two accounts share a title; keep them apart.
+                title = f"{title} ({entry_id})"
+            counts[title] = count
+        return dict(sorted(counts.items()))
@@ -0,0 +1,143 @@
+"""Dedicated HTTP connection pools for courier APIs."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import urllib.parse
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.ssl import client_context
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SESSION_MANAGER = "_session_manager"
+
+# Connector tuning shared by every courier pool.
+POOL_LIMIT = 20
+POOL_LIMIT_PER_HOST = 6
+DNS_CACHE_TTL = 600
+KEEPALIVE_TIMEOUT = 120
+PREWARM_TIMEOUT = 10
+
+
+class CourierSessionManager:
+    """Own one aiohttp session per courier, shared by all its accounts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+        # One SSL context for all pools so TLS settings and ciphers are shared.
+        self._ssl_context = client_context()
+
+    @callback
+    def async_get_session(self, courier: str) -> aiohttp.ClientSession:
+        """Return the pooled session for a courier, creating it on first use."""
+        session = self._sessions.get(courier)
+        if session is not None and not session.closed:
+            return session
+
+        stats = self._stats.setdefault(
+            courier,
+            {
+                "requests": 0,
+                "connections_created": 0,
+                "connections_reused": 0,
+                "dns_cache_hits": 0,
+                "dns_cache_misses": 0,
+                "prewarms": 0,
+            },
+        )
+        connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            use_dns_cache=True,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ssl=self._ssl_context,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": SERVER_SOFTWARE},
+            # Sessions are shared between accounts; API clients manage cookies themselves.
+            cookie_jar=aiohttp.DummyCookieJar(),
+            trace_configs=[_build_trace_config(stats)],
+        )
+        self._sessions[courier] = session
+        return session
+
+    async def async_prewarm(self, courier: str, url: str) -> None:
+        """Open a keep-alive connection to the courier host ahead of a poll."""
+        parts = urllib.parse.urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}/"
+        session = self.async_get_session(courier)
+        try:
+            async with session.head(
+                origin,
+                allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(total=PREWARM_TIMEOUT),
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Connection pre-warm for %s failed: %s", origin, err)
+            return
+        self._stats[courier]["prewarms"] += 1
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return pool statistics per courier."""
+        return {
+            courier: {**stats, "closed": self._sessions[courier].closed}
+            for courier, stats in self._stats.items()
+            if courier in self._sessions
+        }
+
+    async def async_close(self) -> None:
+        """Close all pooled sessions."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+
+def _build_trace_config(stats: dict[str, int]) -> aiohttp.TraceConfig:
+    """Count requests, connection reuse and DNS cache hits for a pool."""
+    trace_config = aiohttp.TraceConfig()
+
+    def _increment(key: str):
+        async def _handler(_session, _ctx, _params) -> None:
+            stats[key] += 1
+
+        return _handler
+
+    trace_config.on_request_start.append(_increment("requests"))
+    trace_config.on_connection_create_end.append(_increment("connections_created"))
+    trace_config.on_connection_reuseconn.append(_increment("connections_reused"))
+    trace_config.on_dns_cache_hit.append(_increment("dns_cache_hits"))
+    trace_config.on_dns_cache_miss.append(_increment("dns_cache_misses"))
+    return trace_config
+
+
+@callback
+def async_get_session_manager(hass: HomeAssistant) -> CourierSessionManager:
+    """Return the domain-wide session manager, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    manager = domain_data.get(DATA_SESSION_MANAGER)
+    if manager is None:
+        manager = CourierSessionManager(hass)
+        domain_data[DATA_SESSION_MANAGER] = manager
+
+        async def _async_close(_event: Event) -> None:
+            await manager.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return manager
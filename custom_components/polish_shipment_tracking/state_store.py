@@ -0,0 +1,61 @@
+"""Persistent last-known parcel list per config entry."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Coalesce writes; Home Assistant flushes pending saves on shutdown.
+SAVE_DELAY = 30
+
+
+class ParcelStateStore:
+    """Save the last successfully fetched parcels so setup can start from them."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.parcels"
+        )
+        self._parcels: list[dict] = []
+        self._saved_at: datetime | None = None
+
+    async def async_load(self) -> tuple[list[dict], datetime | None]:
+        """Return the stored parcels and when they were fetched."""
+        try:
+            data = await self._store.async_load()
+        except Exception as err:  # noqa: BLE001 - a broken cache must not block setup
+            _LOGGER.warning("Ignoring unreadable parcel cache: %s", err)
+            return [], None
+        if not isinstance(data, dict) or not isinstance(data.get("parcels"), list):
+            return [], None
+        saved_at = data.get("saved_at")
+        return data["parcels"], dt_util.parse_datetime(saved_at) if saved_at else None
+
+    @callback
+    def async_save(self, parcels: list[dict], saved_at: datetime) -> None:
+        """Schedule a write of the latest parcel list."""
+        self._parcels = parcels
+        self._saved_at = saved_at
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the stored data."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "saved_at": self._saved_at.isoformat() if self._saved_at else None,
+            "parcels": self._parcels,
+        }
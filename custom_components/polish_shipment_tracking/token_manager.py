@@ -0,0 +1,124 @@
+"""Proactive, single-flight access token refresh for courier accounts."""
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections.abc import Awaitable, Callable
+import json
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh tokens this many seconds before they expire.
+REFRESH_MARGIN = 120
+# Background refreshes run this many seconds before the token is next needed.
+REFRESH_LEAD = 30
+# Forced refreshes right after a completed one reuse its result.
+REFRESH_COOLDOWN = 10
+
+
+def decode_jwt_expiry(token: str | None) -> float | None:
+    """Return the ``exp`` claim of a JWT as a UNIX timestamp, if present."""
+    if not token or token.count(".") != 2:
+        return None
+    payload = token.split(".")[1]
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (ValueError, TypeError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return float(exp)
+    return None
+
+
+class TokenRefreshManager:
+    """Serialise token refreshes for one account and refresh ahead of expiry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        refresh: Callable[[], Awaitable[None]],
+        get_expiry: Callable[[], float | None],
+    ) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        self.name = name
+        self.refresh_count = 0
+        self._refresh = refresh
+        self._get_expiry = get_expiry
+        self._lock = asyncio.Lock()
+        self._inflight: asyncio.Future | None = None
+        self._last_refresh: float | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    def needs_refresh(self) -> bool:
+        """Return True if the token is known to expire within the margin."""
+        expires_at = self._get_expiry()
+        return bool(expires_at) and time.time() > expires_at - REFRESH_MARGIN
+
+    async def async_ensure_valid(self) -> None:
+        """Refresh the token only if it is about to expire."""
+        await self._async_refresh(force=False)
+
+    async def async_refresh(self) -> None:
+        """Refresh the token, e.g. after the courier rejected it."""
+        await self._async_refresh(force=True)
+
+    async def _async_refresh(self, force: bool) -> None:
+        async with self._lock:
+            task = self._inflight
+            if task is None:
+                if not force and not self.needs_refresh():
+                    return
+                if (
+                    force
+                    and self._last_refresh is not None
+                    and time.monotonic() - self._last_refresh < REFRESH_COOLDOWN
+                ):
+                    # A refresh just finished; the caller raced with it on the old token.
+                    return
+                task = self._inflight = asyncio.ensure_future(self._async_run_refresh())
+        await asyncio.shield(task)
+
+    async def _async_run_refresh(self) -> None:
+        try:
+            _LOGGER.debug("Refreshing %s access token", self.name)
+            await self._refresh()
+            self.refresh_count += 1
+            self._last_refresh = time.monotonic()
+        finally:
+            self._inflight = None
+
+    @callback
+    def async_schedule(self, next_use_in: float | None) -> None:
+        """Schedule a background refresh if the token expires before its next use."""
+        self.async_cancel()
+        expires_at = self._get_expiry()
+        if not expires_at or next_use_in is None:
+            return
+        if expires_at - REFRESH_MARGIN > time.time() + next_use_in:
+            return
+        # Refresh just before the next use so the poll itself never waits on it.
+        delay = max(0.0, next_use_in - REFRESH_LEAD)
+
+        async def _async_background_refresh(_now) -> None:
+            self._unsub_timer = None
+            try:
+                await self._async_refresh(force=False)
+            except Exception as err:  # noqa: BLE001 - the next poll retries reactively
+                _LOGGER.debug("Background %s token refresh failed: %s", self.name, err)
+
+        self._unsub_timer = async_call_later(self.hass, delay, _async_background_refresh)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel a scheduled background refresh."""
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
@@ -0,0 +1,230 @@
+"""Parity check and microbenchmark for status normalisation.
+
+Compares ``helpers.normalize_status`` against the original substring
+cascade on every mapped status, the synthetic stub statuses and a corpus of
+free-text statuses, then times both implementations.
+
+Usage:
+  python tools/bench_status.py --number 20000
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+from pathlib import Path
+import sys
+import timeit
+import types
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / "polish_shipment_tracking"
+
+# Free-text statuses that exercise every fallback rule and its precedence.
+CORPUS = [
+    "",
+    "   ",
+    "Ready",
+    "ready",
+    "Ready to send",
+    "Ready for collection",
+    "Ready to pick up at point",
+    "Delivered to locker",
+    "Delivered to pickup point",
+    "Delivered",
+    "Delivered to sender",
+    "Picked up by courier",
+    "Collected by recipient",
+    "Parcel collected",
+    "Pickup point changed",
+    "Collection delayed",
+    "Awizo pozostawione",
+    "Przesyłka awizowana",
+    "Odebrana w placówce",
+    "Wydano do doręczenia",
+    "Doręczona",
+    "Dostarczono",
+    "Zwrot do nadawcy",
+    "Odesłana",
+    "Anulowana",
+    "Rezygnacja z odbioru",
+    "Problem z doręczeniem",
+    "Niedoręczona",
+    "Odmowa przyjęcia",
+    "Out for delivery",
+    "Handed over for delivery",
+    "Return in progress",
+    "Returned",
+    "Cancelled by sender",
+    "Canceled",
+    "Delivery failed",
+    "Delay in delivery",
+    "Exception",
+    "Undeliverable",
+    "Missing",
+    "Rejected by receiver",
+    "In transit",
+    "In transport",
+    "Departed facility",
+    "Arrived at hub",
+    "Processed",
+    "Received in depot",
+    "Adopted at sorting center",
+    "Created",
+    "Pre-transit",
+    "Label printed",
+    "Confirmed",
+    "Info received",
+    "Something else entirely",
+    "ŁÓDŹ SORTOWNIA",
+    "ZAŻÓŁĆ GĘŚLĄ JAŹŃ",
+    12345,
+    None,
+]
+
+
+def load_helpers() -> types.ModuleType:
+    """Import helpers.py without importing the Home Assistant integration."""
+    package = types.ModuleType("polish_shipment_tracking")
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules.setdefault("polish_shipment_tracking", package)
+    for name in ("const", "helpers"):
+        spec = importlib.util.spec_from_file_location(
+            f"polish_shipment_tracking.{name}", PACKAGE_DIR / f"{name}.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+    return sys.modules["polish_shipment_tracking.helpers"]
+
+
+def make_legacy_normalize(status_map):
+    """Return the original cascade implementation of normalize_status."""
+
+    def legacy_normalize_status(raw_status, courier):
+        status_text = str(raw_status or "").strip()
+        if not status_text:
+            return "unknown"
+
+        status_upper = status_text.upper()
+        courier_map = status_map.get(courier, {})
+        if status_upper in courier_map:
+            return courier_map[status_upper]
+
+        status_lower = status_text.lower()
+        status_ascii = status_lower.translate(str.maketrans("ąćęłńóśżź", "acelnoszz"))
+
+        if status_lower in {"ready"}:
+            return "waiting_for_pickup"
+        if any(x in status_lower for x in ["delivered to locker", "delivered to point", "delivered to parcel locker", "delivered to pickup point"]):
+            return "waiting_for_pickup"
+        if any(x in status_lower for x in ["picked up", "collected by", "collected"]):
+            return "delivered"
+        if any(x in status_lower for x in ["ready for collection", "ready to pick", "ready for pick"]):
+            return "waiting_for_pickup"
+        if any(x in status_lower for x in ["pickup", "collection", "locker"]):
+            return "waiting_for_pickup"
+        if "delivered" in status_lower:
+            return "delivered"
+        if "awizo" in status_ascii:
+            return "waiting_for_pickup"
+        if any(x in status_ascii for x in ["odebr", "wydan", "odebrane"]):
+            return "delivered"
+        if any(x in status_ascii for x in ["dorecz", "dostarcz"]):
+            return "delivered"
+        if any(x in status_ascii for x in ["zwrot", "odesl"]):
+            return "returned"
+        if any(x in status_ascii for x in ["anul", "rezygn"]):
+            return "cancelled"
+        if any(x in status_ascii for x in ["problem", "niedorecz", "odmow"]):
+            return "exception"
+        if any(x in status_lower for x in ["out for delivery", "handed over for delivery"]):
+            return "handed_out_for_delivery"
+        if any(x in status_lower for x in ["return", "returned"]):
+            return "returned"
+        if any(x in status_lower for x in ["cancel", "canceled", "cancelled"]):
+            return "cancelled"
+        if any(x in status_lower for x in ["fail", "failed", "delay", "exception", "undeliver", "missing", "rejected"]):
+            return "exception"
+        if any(x in status_lower for x in ["transit", "in transport", "departed", "arrived", "processed", "received", "adopted"]):
+            return "in_transport"
+        if any(x in status_lower for x in ["created", "pre-transit", "label", "confirmed", "info received", "ready to send"]):
+            return "created"
+
+        return "unknown"
+
+    return legacy_normalize_status
+
+
+def build_cases(helpers) -> list[tuple[object, str]]:
+    """Return (raw status, courier) pairs covering maps and fallbacks."""
+    couriers = list(helpers._STATUS_MAP)
+    cases = []
+    for courier, mapping in helpers._STATUS_MAP.items():
+        for status in mapping:
+            cases.append((status, courier))
+            cases.append((status.lower(), courier))
+            cases.append((status.replace("_", " ").title(), courier))
+    for courier in couriers + ["unknown_courier"]:
+        for status in CORPUS:
+            cases.append((status, courier))
+            if isinstance(status, str):
+                cases.append((status.upper(), courier))
+                cases.append((f"  {status} - update ", courier))
+    return cases
+
+
+def check_parity(helpers, legacy, cases) -> int:
+    """Print every mismatch and return how many there were."""
+    mismatches = 0
+    for raw_status, courier in cases:
+        expected = legacy(raw_status, courier)
+        actual = helpers.normalize_status(raw_status, courier)
+        if expected != actual:
+            mismatches += 1
+            print(f"MISMATCH {courier!r} {raw_status!r}: legacy={expected} new={actual}")
+    return mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000, help="calls timed per implementation")
+    args = parser.parse_args()
+
+    helpers = load_helpers()
+    legacy = make_legacy_normalize(helpers._STATUS_MAP)
+    cases = build_cases(helpers)
+
+    mismatches = check_parity(helpers, legacy, cases)
+    print(f"parity: {len(cases) - mismatches}/{len(cases)} cases match")
+    if mismatches:
+        return 1
+
+    def uncached(raw_status, courier, normalize=helpers._normalize_status_text.__wrapped__):
+        status_text = str(raw_status or "").strip()
+        return normalize(courier, status_text) if status_text else "unknown"
+
+    # A refresh normalises the same statuses over and over; mirror that mix.
+    fallback_cases = [(status, "dhl") for status in CORPUS]
+    for label, workload in (("all cases", cases), ("fallback only", fallback_cases)):
+        calls = (workload * (args.number // len(workload) + 1))[: args.number]
+
+        def run(func, calls=calls):
+            for raw_status, courier in calls:
+                func(raw_status, courier)
+
+        legacy_time = min(timeit.repeat(lambda: run(legacy), number=1, repeat=5))
+        helpers._normalize_status_text.cache_clear()
+        cold_time = timeit.timeit(lambda: run(helpers.normalize_status), number=1)
+        warm_time = min(timeit.repeat(lambda: run(helpers.normalize_status), number=1, repeat=5))
+        uncached_time = min(timeit.repeat(lambda: run(uncached), number=1, repeat=5))
+        per_call = 1e6 / args.number
+        print(
+            f"{label:>13}: legacy {legacy_time * per_call:.2f}us/call, "
+            f"uncached {uncached_time * per_call:.2f}us/call, "
+            f"cached cold {cold_time * per_call:.2f}us/call, "
+            f"cached warm {warm_time * per_call:.2f}us/call"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,474 @@
+"""Local stand-in server for the InPost, DPD, DHL and Pocztex APIs.
+
+Serves every endpoint the integration's API clients call, including the
+Pocztex Keycloak login form, so refreshes can be benchmarked and
+regression-tested without real courier accounts.
+
+Modes:
+  synthetic  generated parcels (default)
+  replay     responses recorded in a fixture file, synthetic for the rest
+  record     proxy to the real courier APIs and save responses as fixtures
+
+Fault injection applies in every mode: fixed latency with jitter, 5xx
+errors, 429 throttling with Retry-After and hanging requests (timeouts).
+
+Usage:
+  python tools/courier_stub_server.py --port 8765 --parcels 50 --latency 80
+
+Point the clients at the server before creating them:
+  from courier_stub_server import point_clients_at
+  point_clients_at("http://127.0.0.1:8765")
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+from pathlib import Path
+import random
+import secrets
+import time
+from typing import Any
+
+from aiohttp import ClientSession, web
+
+# Path prefix served by the stub -> real upstream base used in record mode.
+UPSTREAMS = {
+    "inpost": "https://api-inmobile-pl.easypack24.net",
+    "dpd-sso": "https://dpdsso.dpd.com.pl",
+    "dpd": "https://mobapp.dpd.com.pl",
+    "dhl": "https://mojdhl.pl",
+    "pocztex-idm": "https://idm.pocztex.pl",
+    "pocztex": "https://aplikacja.pocztex.pl",
+}
+
+STATUSES = {
+    "inpost": ["CONFIRMED", "ADOPTED_AT_SORTING_CENTER", "OUT_FOR_DELIVERY", "READY_TO_PICKUP"],
+    "dpd": ["READY_TO_SEND", "IN_TRANSPORT", "HANDED_OVER_FOR_DELIVERY", "READY_TO_PICK_UP"],
+    "dhl": ["TT_MAG", "TT_CS", "TT_DWP", "TT_LK"],
+    "pocztex": ["PRZYGOTOWANA", "W TRANSPORCIE", "W DORĘCZENIU", "AWIZOWANA"],
+}
+
+DHL_PAGE_SIZE = 10
+POCZTEX_PAGE_SIZE = 20
+
+
+def point_clients_at(base_url: str) -> None:
+    """Rewrite the API client base URLs so they target the stub server."""
+    from custom_components.polish_shipment_tracking.api_dhl import DhlApi
+    from custom_components.polish_shipment_tracking.api_dpd import DpdApi
+    from custom_components.polish_shipment_tracking.api_inpost import InPostApi
+    from custom_components.polish_shipment_tracking.api_pocztex import PocztexApi
+
+    base = base_url.rstrip("/")
+    InPostApi.BASE_URL = InPostApi.PREWARM_URL = f"{base}/inpost"
+    DpdApi.SSO_URL = f"{base}/dpd-sso"
+    DpdApi.API_URL = DpdApi.PREWARM_URL = f"{base}/dpd"
+    DhlApi.BASE_URL = DhlApi.PREWARM_URL = f"{base}/dhl/api/dhl/public"
+    PocztexApi.AUTH_BASE_URL = f"{base}/pocztex-idm"
+    PocztexApi.API_BASE_URL = PocztexApi.PREWARM_URL = f"{base}/pocztex/api/customer"
+
+
+class FaultInjector:
+    """Delay, fail or throttle requests according to configured rates."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        retry_after: int = 5,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.timeout_rate = timeout_rate
+        self.retry_after = retry_after
+
+    async def apply(self) -> web.Response | None:
+        """Sleep for the configured latency and return a fault response, if any."""
+        delay = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        roll = random.random()
+        if roll < self.timeout_rate:
+            # Longer than the clients' 30 s request timeout.
+            await asyncio.sleep(3600)
+        roll -= self.timeout_rate
+        if roll < self.throttle_rate:
+            return web.json_response(
+                {"error": "too_many_requests"},
+                status=429,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        roll -= self.throttle_rate
+        if roll < self.error_rate:
+            return web.json_response({"error": "injected"}, status=503)
+        return None
+
+
+class FixtureStore:
+    """Recorded responses keyed by method, path and query string."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self._fixtures: dict[str, dict[str, Any]] = {}
+        if path and path.exists():
+            self._fixtures = json.loads(path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def key(request: web.Request) -> str:
+        return f"{request.method} {request.rel_url}"
+
+    def get(self, request: web.Request) -> dict[str, Any] | None:
+        return self._fixtures.get(self.key(request))
+
+    def put(self, request: web.Request, status: int, headers: dict[str, str], body: str) -> None:
+        self._fixtures[self.key(request)] = {"status": status, "headers": headers, "body": body}
+        if self.path:
+            self.path.write_text(
+                json.dumps(self._fixtures, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+
+
+class SyntheticCouriers:
+    """Generated accounts and parcels for all four couriers."""
+
+    def __init__(self, parcel_count: int, seed: int = 0) -> None:
+        rng = random.Random(seed)
+        self.parcels: dict[str, list[dict[str, Any]]] = {}
+        for courier, statuses in STATUSES.items():
+            self.parcels[courier] = [
+                self._make_parcel(courier, index, rng.choice(statuses))
+                for index in range(parcel_count)
+            ]
+        self.codes: set[str] = set()
+
+    @staticmethod
+    def _make_parcel(courier: str, index: int, status: str) -> dict[str, Any]:
+        number = f"{courier[:2].upper()}{100000000 + index}"
+        updated = "2026-01-01T12:00:00Z"
+        if courier == "inpost":
+            return {
+                "shipmentNumber": number,
+                "status": status,
+                "statusChangeDate": updated,
+                "sender": {"name": f"Sender {index}"},
+                "openCode": f"{index:06d}",
+                "receiver": {"phoneNumber": {"value": "600000000", "prefix": "+48"}},
+                "pickUpPoint": {
+                    "addressDetails": {"street": "Testowa", "buildingNumber": str(index), "city": "Warszawa"}
+                },
+            }
+        if courier == "dpd":
+            return {
+                "waybill": number,
+                "main_status": {"status": status, "date": updated},
+                "sender": {"name": f"Sender {index}"},
+            }
+        if courier == "dhl":
+            return {"shipmentNumber": number, "status": status, "menuTimelineLabel": {"status": "Route"}}
+        return {"id": f"id-{index}", "trackingId": number, "status": status, "stateDate": updated}
+
+    def find(self, courier: str, number: str) -> dict[str, Any] | None:
+        for parcel in self.parcels[courier]:
+            if number in (parcel.get("shipmentNumber"), parcel.get("waybill"), parcel.get("id"), parcel.get("trackingId")):
+                return parcel
+        return None
+
+    def token_response(self) -> dict[str, Any]:
+        return {
+            "access_token": secrets.token_urlsafe(24),
+            "refresh_token": secrets.token_urlsafe(24),
+            "expires_in": 300,
+            "refresh_expires_in": 86400,
+        }
+
+
+class StubServer:
+    """aiohttp application emulating the courier API surfaces."""
+
+    def __init__(
+        self,
+        data: SyntheticCouriers,
+        faults: FaultInjector,
+        fixtures: FixtureStore,
+        mode: str = "synthetic",
+    ) -> None:
+        self.data = data
+        self.faults = faults
+        self.fixtures = fixtures
+        self.mode = mode
+        self.request_count: dict[str, int] = {}
+        self._upstream: ClientSession | None = None
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_routes(
+            [
+                # InPost
+                web.post("/inpost/v1/account", self._ok),
+                web.post("/inpost/v1/account/verification", self._inpost_tokens),
+                web.post("/inpost/v1/authenticate", self._inpost_tokens),
+                web.get("/inpost/v4/parcels/tracked", self._inpost_list),
+                web.get("/inpost/v4/parcels/tracked/{number}", self._single("inpost")),
+                # DPD
+                web.put("/dpd-sso/api/phone-verifications/{phone}", self._ok),
+                web.post("/dpd-sso/api/users", self._dpd_register),
+                web.post("/dpd-sso/auth/realms/DPD/protocol/openid-connect/token", self._oidc_token),
+                web.post("/dpd/mdupackageservices/api/v1/packages", self._dpd_list),
+                web.get("/dpd/mdupackageservices/api/v1/packages/{number}", self._single("dpd")),
+                web.get("/dpd/mdupackageservices/api/v1/packages/{number}/management", self._dpd_manage),
+                # DHL
+                web.post("/dhl/api/dhl/public/auth/validate-account", self._ok),
+                web.post("/dhl/api/dhl/public/auth/generate-code", self._ok),
+                web.post("/dhl/api/dhl/public/auth/validate-code", self._dhl_token),
+                web.post("/dhl/api/dhl/public/auth/recover", self._dhl_token),
+                web.post("/dhl/api/dhl/public/user/shipment/v2.1/list/incoming/active/{page}", self._dhl_list),
+                web.get("/dhl/api/dhl/public/user/shipment/v2/details/{number}", self._single("dhl")),
+                # Pocztex (Keycloak login + customer API)
+                web.get("/pocztex-idm/realms/{realm}/protocol/openid-connect/auth", self._pocztex_login_form),
+                web.post("/pocztex-idm/realms/{realm}/login-actions/authenticate", self._pocztex_login_post),
+                web.post("/pocztex-idm/realms/{realm}/protocol/openid-connect/token", self._oidc_token),
+                web.get("/pocztex/api/customer/tracking", self._pocztex_list),
+                web.get("/pocztex/api/customer/tracking/{number}/details", self._pocztex_details),
+            ]
+        )
+        app.on_cleanup.append(self._close_upstream)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        resource = request.match_info.route.resource
+        endpoint = f"{request.method} {resource.canonical if resource else request.path}"
+        self.request_count[endpoint] = self.request_count.get(endpoint, 0) + 1
+
+        fault = await self.faults.apply()
+        if fault is not None:
+            return fault
+
+        if self.mode == "record":
+            return await self._record(request)
+        if self.mode == "replay":
+            recorded = self.fixtures.get(request)
+            if recorded is not None:
+                return web.Response(
+                    status=recorded["status"],
+                    headers=recorded.get("headers", {}),
+                    text=recorded["body"],
+                )
+
+        response = await handler(request)
+        return self._conditional(request, response)
+
+    @staticmethod
+    def _conditional(request: web.Request, response: web.StreamResponse) -> web.StreamResponse:
+        """Add an ETag to GET JSON responses and answer If-None-Match with 304."""
+        if request.method != "GET" or not isinstance(response, web.Response) or response.status != 200:
+            return response
+        if response.body is None:
+            return response
+        etag = '"' + hashlib.sha1(bytes(response.body)).hexdigest() + '"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return response
+
+    async def _record(self, request: web.Request) -> web.Response:
+        prefix, _, rest = request.path.lstrip("/").partition("/")
+        upstream = UPSTREAMS.get(prefix)
+        if upstream is None:
+            raise web.HTTPNotFound()
+        if self._upstream is None:
+            self._upstream = ClientSession()
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in ("host", "content-length")}
+        async with self._upstream.request(
+            request.method,
+            f"{upstream}/{rest}",
+            params=request.query,
+            data=await request.read(),
+            headers=headers,
+            allow_redirects=False,
+        ) as resp:
+            body = await resp.text()
+            keep = {k: v for k, v in resp.headers.items() if k.lower() in ("content-type", "location", "etag", "retry-after")}
+            self.fixtures.put(request, resp.status, keep, body)
+            return web.Response(status=resp.status, headers=keep, text=body)
+
+    async def _close_upstream(self, _app: web.Application) -> None:
+        if self._upstream is not None:
+            await self._upstream.close()
+
+    # --- Shared handlers ---
+
+    async def _ok(self, _request: web.Request) -> web.Response:
+        return web.json_response({})
+
+    async def _oidc_token(self, _request: web.Request) -> web.Response:
+        return web.json_response(self.data.token_response())
+
+    def _single(self, courier: str):
+        async def _handler(request: web.Request) -> web.Response:
+            parcel = self.data.find(courier, request.match_info["number"])
+            if parcel is None:
+                raise web.HTTPNotFound()
+            return web.json_response(parcel)
+
+        return _handler
+
+    # --- InPost ---
+
+    async def _inpost_tokens(self, _request: web.Request) -> web.Response:
+        return web.json_response(
+            {"authToken": _fake_jwt(3600), "refreshToken": secrets.token_urlsafe(24)}
+        )
+
+    async def _inpost_list(self, _request: web.Request) -> web.Response:
+        return web.json_response({"parcels": self.data.parcels["inpost"], "more": False})
+
+    # --- DPD ---
+
+    async def _dpd_register(self, _request: web.Request) -> web.Response:
+        return web.json_response({"code": secrets.token_hex(8)})
+
+    async def _dpd_list(self, _request: web.Request) -> web.Response:
+        summaries = [
+            {"waybill": p["waybill"], "main_status": p["main_status"]}
+            for p in self.data.parcels["dpd"]
+        ]
+        return web.json_response({"packages": summaries})
+
+    async def _dpd_manage(self, request: web.Request) -> web.Response:
+        return web.json_response({"link": f"https://example.invalid/manage/{request.match_info['number']}"})
+
+    # --- DHL ---
+
+    async def _dhl_token(self, _request: web.Request) -> web.Response:
+        return web.json_response(
+            {"accessToken": _fake_jwt(3600)},
+            headers={"Set-Cookie": f"session={secrets.token_hex(8)}; Path=/"},
+        )
+
+    async def _dhl_list(self, request: web.Request) -> web.Response:
+        page = int(request.match_info["page"])
+        parcels = self.data.parcels["dhl"]
+        total_pages = max(1, -(-len(parcels) // DHL_PAGE_SIZE))
+        start = (page - 1) * DHL_PAGE_SIZE
+        return web.json_response(
+            {
+                "shipments": parcels[start:start + DHL_PAGE_SIZE],
+                "page": page,
+                "totalPages": total_pages,
+                "totalCount": len(parcels),
+            }
+        )
+
+    # --- Pocztex ---
+
+    async def _pocztex_login_form(self, request: web.Request) -> web.Response:
+        realm = request.match_info["realm"]
+        action = f"/pocztex-idm/realms/{realm}/login-actions/authenticate?session_code=abc&amp;tab_id=1"
+        html = (
+            "<html><body>"
+            f'<form id="kc-form-login" action="{action}" method="post">'
+            '<input type="hidden" name="credentialId" value="">'
+            '<input name="username"><input name="password" type="password">'
+            "</form></body></html>"
+        )
+        return web.Response(text=html, content_type="text/html")
+
+    async def _pocztex_login_post(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        if not form.get("username") or not form.get("password"):
+            return web.Response(status=200, text="<html>Invalid username or password.</html>", content_type="text/html")
+        code = secrets.token_hex(8)
+        self.data.codes.add(code)
+        raise web.HTTPFound(f"pocztex://auth/redirect?state=x&code={code}")
+
+    async def _pocztex_list(self, request: web.Request) -> web.Response:
+        parcels = self.data.parcels["pocztex"]
+        page = int(request.query.get("page", 0))
+        size = int(request.query.get("size", POCZTEX_PAGE_SIZE))
+        start = page * size
+        summaries = [
+            {k: p[k] for k in ("id", "trackingId", "status", "stateDate")}
+            for p in parcels[start:start + size]
+        ]
+        total_pages = max(1, -(-len(parcels) // size))
+        return web.json_response(
+            {
+                "content": summaries,
+                "number": page,
+                "size": size,
+                "totalPages": total_pages,
+                "totalElements": len(parcels),
+                "last": page >= total_pages - 1,
+            }
+        )
+
+    async def _pocztex_details(self, request: web.Request) -> web.Response:
+        parcel = self.data.find("pocztex", request.match_info["number"])
+        if parcel is None:
+            raise web.HTTPNotFound()
+        details = {
+            **parcel,
+            "senderName": "Nadawca",
+            "recipientName": "Odbiorca",
+            "history": [{"date": parcel["stateDate"], "state": parcel["status"]}],
+        }
+        return web.json_response(details)
+
+
+def _fake_jwt(lifetime: int) -> str:
+    """Return an unsigned JWT whose exp claim is ``lifetime`` seconds away."""
+
+    def _segment(data: dict[str, Any]) -> str:
+        raw = json.dumps(data, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    return ".".join(
+        [_segment({"alg": "none"}), _segment({"exp": int(time.time()) + lifetime}), "sig"]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--mode", choices=("synthetic", "replay", "record"), default="synthetic")
+    parser.add_argument("--fixtures", type=Path, help="fixture file to replay from / record to")
+    parser.add_argument("--parcels", type=int, default=20, help="synthetic parcels per courier")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="added latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra latency in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 503 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of 429 responses")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="fraction of hanging requests")
+    parser.add_argument("--retry-after", type=int, default=5, help="Retry-After seconds sent with 429")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = StubServer(
+        SyntheticCouriers(args.parcels, args.seed),
+        FaultInjector(
+            latency_ms=args.latency,
+            jitter_ms=args.jitter,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            timeout_rate=args.timeout_rate,
+            retry_after=args.retry_after,
+        ),
+        FixtureStore(args.fixtures),
+        mode=args.mode,
+    )
+    web.run_app(server.build_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()